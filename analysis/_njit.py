@@ -0,0 +1,23 @@
+"""
+Numba JIT兼容层
+
+未安装numba时，njit退化为不做任何处理的装饰器，被装饰的函数按普通Python函数执行。
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """numba.njit的空实现，支持@njit和@njit(...)两种写法"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+__all__ = ['njit', 'NUMBA_AVAILABLE']
@@ -1,11 +1,32 @@
 import os
 import json
+import importlib.util
+import asyncio
+import threading
 import logging
 import time
+import random
+import math
+from dataclasses import asdict, is_dataclass
 from datetime import datetime
-import requests
+import httpx
 import pandas as pd
-from typing import Dict, List, Optional
+from typing import Dict, Final, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 # 设置日志
 logging.basicConfig(
@@ -13,6 +34,170 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger('ai_analysis')
+# httpx默认在INFO级别记录每个请求，避免刷屏
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+# API请求失败重试: 可重试的状态码、最大重试次数、退避基数(秒)，连接失败同样重试
+_RETRY_STATUS = (429, 500, 502, 503, 504)
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.2
+
+# HTTP/2需要h2包，未安装时使用HTTP/1.1
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# 模拟分析使用的候选项
+_RNG = random.Random()
+_MOCK_TRENDS = ("看涨", "看跌", "震荡")
+_MOCK_ACTIONS = ("买入", "卖出", "持有")
+_MOCK_REASONS = {
+    "看涨": (
+        "技术指标显示超卖，有反弹机会",
+        "价格突破关键阻力位，上升趋势形成",
+        "成交量放大，市场情绪积极"
+    ),
+    "看跌": (
+        "出现顶部反转信号，可能开始下跌",
+        "价格跌破重要支撑位，下行压力增加",
+        "成交量低迷，缺乏上涨动力"
+    ),
+    "震荡": (
+        "市场处于盘整阶段，等待方向确认",
+        "技术指标中性，无明显信号",
+        "价格波动减小，可能即将突破"
+    )
+}
+
+# 系统提示
+_SYSTEM_PROMPT: Final[str] = "你是一位专业的加密货币分析师，根据市场数据提供交易建议。"
+
+# AI提示末尾的输出要求
+_PROMPT_INSTRUCTIONS: Final[str] = """
+        请分析以上数据，并提供以下内容:
+        1. 市场趋势预测 (看涨/看跌/震荡)
+        2. 置信度 (0-100%)
+        3. 建议操作 (买入/卖出/持有)
+        4. 理由
+        
+        请以JSON格式返回结果，格式如下:
+        {
+            "trend": "看涨",
+            "confidence": 80,
+            "action": "买入",
+            "reason": "技术指标显示超卖，有反弹机会"
+        }
+        """
+
+# 批量分析时AI提示末尾的输出要求
+_BATCH_PROMPT_INSTRUCTIONS: Final[str] = """
+        请分别分析以上每个交易对的数据，并为每个交易对提供以下内容:
+        1. 市场趋势预测 (看涨/看跌/震荡)
+        2. 置信度 (0-100%)
+        3. 建议操作 (买入/卖出/持有)
+        4. 理由
+        
+        请以JSON数组格式返回结果，每个交易对一项，格式如下:
+        [
+            {
+                "symbol": "BTC/USDT",
+                "trend": "看涨",
+                "confidence": 80,
+                "action": "买入",
+                "reason": "技术指标显示超卖，有反弹机会"
+            }
+        ]
+        """
+
+def _json_loads(content):
+    """解析JSON，优先使用orjson"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _walk_pointer(obj, pointer: str):
+    """按JSON Pointer（如/choices/0/message/content）读取字段，不存在时返回None"""
+    for key in pointer.strip("/").split("/"):
+        try:
+            obj = obj[int(key)] if isinstance(obj, list) else obj[key]
+        except (KeyError, IndexError, ValueError, TypeError):
+            return None
+    return obj
+
+class _JsonObjectScanner:
+    """增量扫描文本，定位第一个完整的JSON对象或数组（跳过字符串中的括号）"""
+    
+    def __init__(self, opener: str = "{"):
+        self._opener = opener
+        self._closer = "]" if opener == "[" else "}"
+        self.start = -1
+        self.end = -1
+        self._offset = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+    
+    def feed(self, chunk: str) -> bool:
+        """
+        追加一段文本
+        
+        Returns:
+            bool: 是否已找到完整的JSON对象，位置为[start, end)
+        """
+        for i, ch in enumerate(chunk, self._offset):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = self._depth > 0
+            elif ch == self._opener:
+                if self._depth == 0:
+                    self.start = i
+                self._depth += 1
+            elif ch == self._closer and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = i + 1
+                    self._offset = i + 1
+                    return True
+        self._offset += len(chunk)
+        return False
+
+def _first_json_object(text: str, opener: str = "{") -> Optional[str]:
+    """单次扫描提取文本中第一个完整的JSON对象（opener为"["时提取数组），未找到时返回None"""
+    scanner = _JsonObjectScanner(opener)
+    if scanner.feed(text):
+        return text[scanner.start:scanner.end]
+    return None
+
+def _json_default(obj):
+    """标准json无法直接序列化的对象（NumPy数组等）"""
+    if hasattr(obj, "tolist"):
+        return _json_safe(obj.tolist())
+    raise TypeError(f"无法序列化类型: {type(obj).__name__}")
+
+def _json_safe(obj):
+    """将指标dataclass、NumPy标量展开为基本类型，NaN和无穷大替换为None，与orjson输出的null一致"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _json_safe(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_safe(value) for value in obj]
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _json_safe(asdict(obj))
+    if getattr(obj, "ndim", None) == 0 and hasattr(obj, "item"):
+        # NumPy标量
+        return _json_safe(obj.item())
+    return obj
+
+def _json_dumps(obj) -> str:
+    """序列化为紧凑的JSON字符串（保留非ASCII字符），优先使用orjson；两种实现的输出相同，NaN均输出为null"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(_json_safe(obj), ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_json_default)
 
 class AIAnalyzer:
     """AI分析类"""
@@ -26,21 +211,42 @@ class AIAnalyzer:
         """
         self.config = config or {}
         self.symbols = self.config.get("symbols", ["BTC/USDT"])
+        self.batch_size = self.config.get("batch_size", 5)  # 单次API调用分析的交易对数量
+        self.max_concurrent_requests = self.config.get("max_concurrent_requests", 8)  # 异步并发请求上限
+        self.stream = self.config.get("stream", False)  # 单个交易对分析是否使用流式输出
         
         # 初始化API配置
         self.api_key = os.getenv("DEEPSEEK_API_KEY", "")
         self.api_url = os.getenv("DEEPSEEK_API_URL", "https://api.deepseek.com/v1")
         self.api_path = os.getenv("DEEPSEEK_API_PATH", "/chat/completions")
+        self.model = self.config.get("model", "deepseek-chat")
+        self._headers = {
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        
+        # 安装了h2时使用HTTP/2，并发请求复用同一个TLS连接；重试统一由_call_api处理
+        self._client = httpx.Client(
+            headers=self._headers,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8)
+        )
+        
+        # simdjson解析器可复用，只读取需要的字段；解析器不是线程安全的，每个线程各用一个
+        self._sj_local = threading.local()
         
         logger.info("初始化AI分析模块")
     
-    def analyze_market_data(self, market_data: Dict, social_data: Dict = None) -> Dict:
+    def analyze_market_data(self, market_data: Dict, social_data: Dict = None, stream: Optional[bool] = None) -> Dict:
         """
         分析市场数据
         
         Args:
             market_data: 市场数据
             social_data: 社交媒体数据
+            stream: 是否使用流式输出，收到第一个完整的JSON对象后提前结束；为空时使用配置项stream（默认关闭）
             
         Returns:
             Dict: 分析结果
@@ -55,10 +261,10 @@ class AIAnalyzer:
             prompt = self._generate_prompt(market_data, social_data)
             
             # 调用API
-            response = self._call_api(prompt)
+            content = self._call_api(prompt, stream=self.stream if stream is None else stream)
             
             # 解析API响应
-            analysis = self._parse_api_response(response, market_data["symbol"])
+            analysis = self._parse_api_response(content, market_data["symbol"])
             
             return analysis
             
@@ -66,103 +272,336 @@ class AIAnalyzer:
             logger.error(f"分析市场数据失败: {str(e)}")
             return self._generate_mock_analysis(market_data["symbol"])
     
+    async def analyze_market_data_async(self, market_data: Dict, social_data: Dict = None, session=None) -> Dict:
+        """
+        异步分析市场数据
+        
+        Args:
+            market_data: 市场数据
+            social_data: 社交媒体数据
+            session: 共享的aiohttp.ClientSession，为空时使用临时会话
+            
+        Returns:
+            Dict: 分析结果
+        """
+        try:
+            # 如果没有API密钥，返回模拟数据
+            if not self.api_key:
+                logger.info("未设置API密钥，使用模拟分析")
+                return self._generate_mock_analysis(market_data["symbol"])
+            
+            prompt = self._generate_prompt(market_data, social_data)
+            content = await self._call_api_async(prompt, session)
+            
+            return self._parse_api_response(content, market_data["symbol"])
+            
+        except Exception as e:
+            logger.error(f"分析市场数据失败: {str(e)}")
+            return self._generate_mock_analysis(market_data["symbol"])
+    
+    async def analyze_markets_async(self, items: List[Tuple[Dict, Optional[Dict]]]) -> Dict[str, Dict]:
+        """
+        并发分析多个交易对，每batch_size个交易对合并为一次API调用，同时进行的请求数不超过max_concurrent_requests
+        
+        Args:
+            items: (市场数据, 社交媒体数据)列表
+            
+        Returns:
+            Dict[str, Dict]: 交易对 -> 分析结果
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        timestamp = datetime.now().isoformat()
+        batches = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        
+        async def analyze(batch, session):
+            async with semaphore:
+                if len(batch) == 1:
+                    market_data, social_data = batch[0]
+                    return {market_data["symbol"]: await self.analyze_market_data_async(market_data, social_data, session)}
+                return await self.analyze_market_data_batch_async(batch, timestamp, session)
+        
+        if aiohttp is not None and self.api_key:
+            connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            async with aiohttp.ClientSession(connector=connector) as session:
+                results = await asyncio.gather(*(analyze(batch, session) for batch in batches))
+        else:
+            results = await asyncio.gather(*(analyze(batch, None) for batch in batches))
+        
+        # 按输入顺序返回各交易对的结果
+        merged = {symbol: analysis for result in results for symbol, analysis in result.items()}
+        return {market_data["symbol"]: merged[market_data["symbol"]] for market_data, _ in items}
+    
+    async def _call_api_async(self, prompt: str, session=None) -> str:
+        """异步调用AI API，未安装aiohttp时在线程中执行同步调用"""
+        if aiohttp is None:
+            return await asyncio.to_thread(self._call_api, prompt)
+        
+        if session is None:
+            async with aiohttp.ClientSession() as temp_session:
+                return await self._call_api_async(prompt, temp_session)
+        
+        try:
+            timeout = aiohttp.ClientTimeout(sock_connect=5, total=60)
+            endpoint = f"{self.api_url}{self.api_path}"
+            async with session.post(endpoint, headers=self._headers, json=self._build_payload(prompt), timeout=timeout) as response:
+                raw = await response.read()
+                if response.status != 200:
+                    logger.error(f"API调用失败: {response.status} {raw.decode(errors='replace')}")
+                    raise Exception(f"API调用失败: {response.status}")
+            
+            return self._read_pointer(raw, "/choices/0/message/content") or ""
+            
+        except Exception as e:
+            logger.error(f"API调用失败: {str(e)}")
+            raise
+    
+    def analyze_market_data_batch(self, items: List[Tuple[Dict, Optional[Dict]]],
+                                  timestamp: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        分析一批交易对，合并为一次API调用（同步版本）
+        
+        Args:
+            items: (市场数据, 社交媒体数据)列表
+            timestamp: 结果时间戳，为空时使用当前时间
+            
+        Returns:
+            Dict[str, Dict]: 交易对 -> 分析结果
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        symbols = [market_data["symbol"] for market_data, _ in items]
+        
+        try:
+            # 如果没有API密钥，返回模拟数据
+            if not self.api_key:
+                logger.info("未设置API密钥，使用模拟分析")
+                parsed = {}
+            else:
+                prompt = self._generate_batch_prompt(items, timestamp)
+                content = self._call_api(prompt)
+                parsed = self._parse_batch_response(content, symbols, timestamp)
+        except Exception as e:
+            logger.error(f"批量分析市场数据失败: {str(e)}")
+            parsed = {}
+        
+        # 未返回结果的交易对使用模拟数据
+        return {symbol: parsed.get(symbol) or self._generate_mock_analysis(symbol, timestamp) for symbol in symbols}
+    
+    def analyze_markets(self, items: List[Tuple[Dict, Optional[Dict]]]) -> Dict[str, Dict]:
+        """
+        依次分析多个交易对，每batch_size个交易对合并为一次API调用（同步版本，用于已有事件循环的线程）
+        
+        Args:
+            items: (市场数据, 社交媒体数据)列表
+            
+        Returns:
+            Dict[str, Dict]: 交易对 -> 分析结果
+        """
+        timestamp = datetime.now().isoformat()
+        results = {}
+        for i in range(0, len(items), self.batch_size):
+            batch = items[i:i + self.batch_size]
+            if len(batch) == 1:
+                market_data, social_data = batch[0]
+                results[market_data["symbol"]] = self.analyze_market_data(market_data, social_data)
+            else:
+                results.update(self.analyze_market_data_batch(batch, timestamp))
+        return results
+    
+    async def analyze_market_data_batch_async(self, items: List[Tuple[Dict, Optional[Dict]]],
+                                              timestamp: Optional[str] = None, session=None) -> Dict[str, Dict]:
+        """
+        异步分析一批交易对，合并为一次API调用
+        
+        Args:
+            items: (市场数据, 社交媒体数据)列表
+            timestamp: 结果时间戳，为空时使用当前时间
+            session: 共享的aiohttp.ClientSession，为空时使用临时会话
+            
+        Returns:
+            Dict[str, Dict]: 交易对 -> 分析结果
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        symbols = [market_data["symbol"] for market_data, _ in items]
+        
+        try:
+            # 如果没有API密钥，返回模拟数据
+            if not self.api_key:
+                logger.info("未设置API密钥，使用模拟分析")
+                parsed = {}
+            else:
+                prompt = self._generate_batch_prompt(items, timestamp)
+                content = await self._call_api_async(prompt, session)
+                parsed = self._parse_batch_response(content, symbols, timestamp)
+        except Exception as e:
+            logger.error(f"批量分析市场数据失败: {str(e)}")
+            parsed = {}
+        
+        # 未返回结果的交易对使用模拟数据
+        return {symbol: parsed.get(symbol) or self._generate_mock_analysis(symbol, timestamp) for symbol in symbols}
+    
     def _generate_prompt(self, market_data: Dict, social_data: Dict = None) -> str:
         """生成AI提示"""
-        symbol = market_data["symbol"]
-        prompt = f"""
+        parts = ["""
         分析以下加密货币市场数据，并提供交易建议:
+        """]
+        self._append_market_section(parts, market_data, social_data)
+        parts.append(_PROMPT_INSTRUCTIONS)
+        
+        return "".join(parts)
+    
+    def _generate_batch_prompt(self, items: List[Tuple[Dict, Optional[Dict]]], timestamp: Optional[str] = None) -> str:
+        """生成多个交易对的AI提示"""
+        timestamp = timestamp or datetime.now().isoformat()
+        parts = ["""
+        分析以下多个加密货币交易对的市场数据，并分别提供交易建议:
+        """]
+        for market_data, social_data in items:
+            self._append_market_section(parts, market_data, social_data, timestamp)
+        parts.append(_BATCH_PROMPT_INSTRUCTIONS)
         
+        return "".join(parts)
+    
+    def _append_market_section(self, parts: List[str], market_data: Dict, social_data: Dict = None,
+                               timestamp: Optional[str] = None):
+        """向提示中追加单个交易对的市场数据"""
+        symbol = market_data["symbol"]
+        timestamp = timestamp or datetime.now().isoformat()
+        parts.append(f"""
         交易对: {symbol}
         当前价格: {market_data.get('current_price', 'N/A')}
-        时间: {datetime.now().isoformat()}
+        时间: {timestamp}
         
         技术指标:
-        """
+        """)
         
         # 添加技术指标
         indicators = market_data.get("indicators", {})
         for indicator_name, indicator_data in indicators.items():
-            prompt += f"- {indicator_name}: {json.dumps(indicator_data, ensure_ascii=False)}\n"
+            parts.append(f"- {indicator_name}: {_json_dumps(indicator_data)}\n")
         
         # 添加交易信号
         signals = market_data.get("signals", {})
-        prompt += "\n交易信号:\n"
-        if signals.get("buy", False):
-            prompt += f"- 买入信号 (强度: {signals.get('strength', 0)})\n"
-            prompt += f"- 原因: {', '.join(signals.get('reason', []))}\n"
-        if signals.get("sell", False):
-            prompt += f"- 卖出信号 (强度: {abs(signals.get('strength', 0))})\n"
-            prompt += f"- 原因: {', '.join(signals.get('reason', []))}\n"
+        parts.append("\n交易信号:\n")
+        if signals.get("buy", False) or signals.get("sell", False):
+            strength = signals.get("strength", 0)
+            reason = ", ".join(signals.get("reason", []))
+            if signals.get("buy", False):
+                parts.append(f"- 买入信号 (强度: {strength})\n- 原因: {reason}\n")
+            if signals.get("sell", False):
+                parts.append(f"- 卖出信号 (强度: {abs(strength)})\n- 原因: {reason}\n")
         
         # 添加社交媒体数据
         if social_data:
-            prompt += "\n社交媒体数据:\n"
-            prompt += f"- 情感得分: {social_data.get('sentiment_score', 'N/A')}\n"
-            prompt += f"- 市场情绪: {social_data.get('market_sentiment', 'N/A')}\n"
-            prompt += f"- 热门话题: {', '.join(social_data.get('hot_topics', []))}\n"
-            prompt += f"- 重要新闻: {', '.join(social_data.get('important_news', []))}\n"
-        
-        prompt += """
-        请分析以上数据，并提供以下内容:
-        1. 市场趋势预测 (看涨/看跌/震荡)
-        2. 置信度 (0-100%)
-        3. 建议操作 (买入/卖出/持有)
-        4. 理由
-        
-        请以JSON格式返回结果，格式如下:
-        {
-            "trend": "看涨",
-            "confidence": 80,
-            "action": "买入",
-            "reason": "技术指标显示超卖，有反弹机会"
+            parts.append(
+                "\n社交媒体数据:\n"
+                f"- 情感得分: {social_data.get('sentiment_score', 'N/A')}\n"
+                f"- 市场情绪: {social_data.get('market_sentiment', 'N/A')}\n"
+                f"- 热门话题: {', '.join(social_data.get('hot_topics', []))}\n"
+                f"- 重要新闻: {', '.join(social_data.get('important_news', []))}\n"
+            )
+    
+    def _build_payload(self, prompt: str, stream: bool = False) -> Dict:
+        """构造API请求体"""
+        data = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.2
         }
+        if stream:
+            data["stream"] = True
+        return data
+    
+    def _call_api(self, prompt: str, stream: bool = False, opener: str = "{") -> str:
         """
+        调用AI API，返回模型回复内容
         
-        return prompt
-    
-    def _call_api(self, prompt: str) -> Dict:
-        """调用AI API"""
+        Args:
+            prompt: AI提示
+            stream: 是否使用流式输出，收到第一个完整的JSON对象（opener为"["时为数组）后即停止读取；
+                    需要完整回复的调用使用普通请求
+            opener: 流式输出时等待的JSON起始字符
+            
+        Returns:
+            str: 模型回复内容
+        """
         try:
             endpoint = f"{self.api_url}{self.api_path}"
             
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
-            
-            data = {
-                "model": "deepseek-chat",
-                "messages": [
-                    {"role": "system", "content": "你是一位专业的加密货币分析师，根据市场数据提供交易建议。"},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.2
-            }
-            
-            response = requests.post(endpoint, headers=headers, json=data)
-            
-            if response.status_code != 200:
-                logger.error(f"API调用失败: {response.status_code} {response.text}")
-                raise Exception(f"API调用失败: {response.status_code}")
-            
-            return response.json()
+            data = self._build_payload(prompt, stream=stream)
+            for attempt in range(_MAX_RETRIES + 1):
+                try:
+                    with self._client.stream("POST", endpoint, json=data) as response:
+                        if response.status_code == 200:
+                            if not stream or not response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                                return self._read_pointer(response.read(), "/choices/0/message/content") or ""
+                            return self._read_stream(response, opener)
+                        
+                        if response.status_code not in _RETRY_STATUS or attempt == _MAX_RETRIES:
+                            response.read()
+                            logger.error(f"API调用失败: {response.status_code} {response.text}")
+                            raise Exception(f"API调用失败: {response.status_code}")
+                    
+                    logger.warning(f"API返回{response.status_code}，第{attempt + 1}次重试...")
+                except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                    # 连接未建立，请求尚未发出，可以安全重试
+                    if attempt == _MAX_RETRIES:
+                        raise
+                    logger.warning(f"连接API失败: {str(e)}，第{attempt + 1}次重试...")
+                
+                time.sleep(_RETRY_BACKOFF * 2 ** attempt)
             
         except Exception as e:
             logger.error(f"API调用失败: {str(e)}")
             raise
     
-    def _parse_api_response(self, response: Dict, symbol: str) -> Dict:
+    def _read_stream(self, response: httpx.Response, opener: str = "{") -> str:
+        """读取流式(SSE)响应，拼接choices[0].delta.content"""
+        parts = []
+        scanner = _JsonObjectScanner(opener)
+        for line in response.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            payload = line[5:].strip()
+            if payload == "[DONE]":
+                break
+            
+            delta = self._read_pointer(payload, "/choices/0/delta/content")
+            if not delta:
+                continue
+            parts.append(delta)
+            if scanner.feed(delta):
+                # 已收到完整的JSON对象，不再等待剩余输出
+                break
+        
+        return "".join(parts)
+    
+    def _read_pointer(self, raw, pointer: str):
+        """从JSON原始数据中读取单个字段，优先使用simdjson按需解析"""
+        if simdjson is not None:
+            parser = getattr(self._sj_local, "parser", None)
+            if parser is None:
+                parser = self._sj_local.parser = simdjson.Parser()
+            try:
+                doc = parser.parse(raw)
+                return doc.at_pointer(pointer)
+            except LookupError:
+                return None
+            except (ValueError, TypeError) as e:
+                logger.debug(f"simdjson解析响应失败，回退到标准解析: {str(e)}")
+        
+        return _walk_pointer(_json_loads(raw), pointer)
+    
+    def _parse_api_response(self, content: str, symbol: str) -> Dict:
         """解析API响应"""
         try:
-            content = response.get("choices", [{}])[0].get("message", {}).get("content", "")
-            
             # 从响应中提取JSON
-            start_pos = content.find("{")
-            end_pos = content.rfind("}")
+            json_str = _first_json_object(content)
             
-            if start_pos != -1 and end_pos != -1:
-                json_str = content[start_pos:end_pos+1]
-                analysis = json.loads(json_str)
+            if json_str is not None:
+                analysis = _json_loads(json_str)
                 analysis["symbol"] = symbol
                 analysis["timestamp"] = datetime.now().isoformat()
                 
@@ -174,35 +613,33 @@ class AIAnalyzer:
             logger.error(f"解析API响应失败: {str(e)}")
             return self._generate_mock_analysis(symbol)
     
-    def _generate_mock_analysis(self, symbol: str) -> Dict:
-        """生成模拟分析结果"""
+    def _parse_batch_response(self, content: str, symbols: List[str], timestamp: Optional[str] = None) -> Dict[str, Dict]:
+        """解析批量分析的API响应，返回交易对 -> 分析结果"""
+        try:
+            json_str = _first_json_object(content, opener="[")
+            if json_str is None:
+                raise Exception("未找到有效的JSON数组响应")
+            
+            timestamp = timestamp or datetime.now().isoformat()
+            results = {}
+            for item in _json_loads(json_str):
+                if isinstance(item, dict) and item.get("symbol") in symbols:
+                    item["timestamp"] = timestamp
+                    results[item["symbol"]] = item
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"解析批量API响应失败: {str(e)}")
+            return {}
+    
+    def _generate_mock_analysis(self, symbol: str, timestamp: Optional[str] = None) -> Dict:
+        """生成模拟分析结果，timestamp为空时使用当前时间"""
         # 随机模拟分析结果
-        import random
-        
-        trends = ["看涨", "看跌", "震荡"]
-        actions = ["买入", "卖出", "持有"]
-        reasons = [
-            "技术指标显示超卖，有反弹机会",
-            "价格突破关键阻力位，上升趋势形成",
-            "成交量放大，市场情绪积极",
-            "出现顶部反转信号，可能开始下跌",
-            "价格跌破重要支撑位，下行压力增加",
-            "成交量低迷，缺乏上涨动力",
-            "市场处于盘整阶段，等待方向确认",
-            "技术指标中性，无明显信号",
-            "价格波动减小，可能即将突破"
-        ]
-        
-        trend = random.choice(trends)
-        action = random.choice(actions)
-        confidence = random.randint(50, 95)
-        
-        if trend == "看涨":
-            reason = random.choice(reasons[:3])
-        elif trend == "看跌":
-            reason = random.choice(reasons[3:6])
-        else:
-            reason = random.choice(reasons[6:])
+        trend = _RNG.choice(_MOCK_TRENDS)
+        action = _RNG.choice(_MOCK_ACTIONS)
+        confidence = _RNG.randint(50, 95)
+        reason = _RNG.choice(_MOCK_REASONS[trend])
         
         return {
             "symbol": symbol,
@@ -210,24 +647,43 @@ class AIAnalyzer:
             "confidence": confidence,
             "action": action,
             "reason": reason,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp or datetime.now().isoformat()
         }
     
-    def get_ai_summary(self) -> Dict:
+    def get_ai_summary(self, market_data: Optional[Dict[str, Dict]] = None,
+                       social_data: Optional[Dict[str, Dict]] = None) -> Dict:
         """
         获取AI分析摘要
         
+        Args:
+            market_data: 交易对 -> 市场数据，提供时按batch_size分批调用AI分析；未提供市场数据的交易对生成模拟分析
+            social_data: 交易对 -> 社交媒体数据
+            
         Returns:
             Dict: AI分析摘要
         """
+        timestamp = datetime.now().isoformat()
         summary = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "symbols": {}
         }
         
+        market_data = market_data or {}
+        social_data = social_data or {}
+        items = [(market_data[symbol], social_data.get(symbol)) for symbol in self.symbols if symbol in market_data]
+        results = {}
+        if items:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # 当前线程没有运行中的事件循环，并发调用
+                results = asyncio.run(self.analyze_markets_async(items))
+            else:
+                # 在事件循环中被同步调用时不能再启动新的循环，改为同步调用
+                results = self.analyze_markets(items)
+        
         for symbol in self.symbols:
-            # 生成模拟分析
-            analysis = self._generate_mock_analysis(symbol)
-            summary["symbols"][symbol] = analysis
+            # 没有市场数据的交易对生成模拟分析
+            summary["symbols"][symbol] = results.get(symbol) or self._generate_mock_analysis(symbol, timestamp)
         
         return summary 
\ No newline at end of file
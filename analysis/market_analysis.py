@@ -1,10 +1,17 @@
+import copy
 import pandas as pd
 import numpy as np
 import logging
 from datetime import datetime, timedelta
 import os
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 from exchanges.exchange_client import ExchangeClient
+from analysis._njit import njit
 
 # 设置日志
 logging.basicConfig(
@@ -13,6 +20,303 @@ logging.basicConfig(
 )
 logger = logging.getLogger('market_analysis')
 
+@dataclass(slots=True, frozen=True)
+class RSIResult:
+    """RSI指标结果"""
+    rsi: float
+    is_overbought: bool
+    is_oversold: bool
+
+@dataclass(slots=True, frozen=True)
+class MACDResult:
+    """MACD指标结果"""
+    macd: float
+    signal: float
+    hist: float
+    is_bullish: bool
+    is_bearish: bool
+
+@dataclass(slots=True, frozen=True)
+class BBResult:
+    """布林带指标结果"""
+    upper: float
+    middle: float
+    lower: float
+    is_overbought: bool
+    is_oversold: bool
+
+# 交易信号规则: (指标, 结果属性, 信号方向, 原因)
+_SIGNAL_RULES = (
+    ("RSI", "is_oversold", 1, "RSI超卖"),
+    ("RSI", "is_overbought", -1, "RSI超买"),
+    ("MACD", "is_bullish", 1, "MACD金叉"),
+    ("MACD", "is_bearish", -1, "MACD死叉"),
+    ("BB", "is_oversold", 1, "价格触及布林带下轨"),
+    ("BB", "is_overbought", -1, "价格触及布林带上轨")
+)
+
+# K线周期单位对应的秒数（大写H/D/W为OKX格式，M为月）
+_TIMEFRAME_UNIT_SECONDS = {
+    's': 1, 'm': 60, 'h': 3600, 'H': 3600, 'd': 86400, 'D': 86400,
+    'w': 604800, 'W': 604800, 'M': 2592000
+}
+
+def _timeframe_seconds(timeframe: str, default: int = 3600) -> int:
+    """将K线周期（如1m、4h、1D）转换为秒数，无法识别时返回default"""
+    try:
+        return int(timeframe[:-1]) * _TIMEFRAME_UNIT_SECONDS[timeframe[-1]]
+    except (KeyError, ValueError, IndexError):
+        return default
+
+def _tail(values: np.ndarray, n: int) -> np.ndarray:
+    """返回最后n个值的视图（不复制数据），n不大于0时返回空数组而不是整个数组"""
+    return values[-n:] if n > 0 else values[:0]
+
+def _close_values(df: pd.DataFrame) -> np.ndarray:
+    """返回收盘价的NumPy视图（不复制数据），各指标共用，避免重复经过pandas列索引"""
+    return df['close'].to_numpy(dtype=np.float64, copy=False)
+
+@njit(cache=True)
+def _rsi_last(close, period):
+    """计算最后一根K线的RSI（简单移动平均口径，与rolling(period).mean()一致）"""
+    n = close.shape[0]
+    if n < period or period <= 0:
+        return np.nan
+    
+    gain_sum = 0.0
+    loss_sum = 0.0
+    # 第一根K线没有差值，按0计入窗口
+    for i in range(max(n - period, 1), n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gain_sum += delta
+        elif delta < 0:
+            loss_sum -= delta
+    
+    if loss_sum == 0.0:
+        return 100.0 if gain_sum > 0.0 else np.nan
+    rs = gain_sum / loss_sum
+    return 100.0 - 100.0 / (1.0 + rs)
+
+@njit(cache=True)
+def _wilder_averages(close, period):
+    """
+    一次遍历计算Wilder平滑后的平均涨幅和平均跌幅
+    
+    以前period个差值的简单平均作为初始值，之后逐个递推；差值不足period个时返回涨跌幅的累计和
+    """
+    n = close.shape[0]
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, min(n, period + 1)):
+        delta = close[i] - close[i - 1]
+        avg_gain += max(delta, 0.0)
+        avg_loss += max(-delta, 0.0)
+    if n <= period:
+        return avg_gain, avg_loss
+    
+    avg_gain /= period
+    avg_loss /= period
+    for i in range(period + 1, n):
+        delta = close[i] - close[i - 1]
+        avg_gain = (avg_gain * (period - 1) + max(delta, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-delta, 0.0)) / period
+    return avg_gain, avg_loss
+
+@njit(cache=True)
+def _rsi_from_averages(avg_gain, avg_loss):
+    """由平均涨幅和平均跌幅计算RSI，没有涨跌时为NaN"""
+    if avg_loss == 0.0:
+        return 100.0 if avg_gain > 0.0 else np.nan
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+@njit(cache=True)
+def _rsi_wilder_last(close, period):
+    """计算最后一根K线的RSI（Wilder平滑）"""
+    if close.shape[0] <= period or period <= 0:
+        return np.nan
+    
+    avg_gain, avg_loss = _wilder_averages(close, period)
+    return _rsi_from_averages(avg_gain, avg_loss)
+
+@njit(cache=True)
+def _macd_state(close, fast_period, slow_period, signal_period):
+    """一次遍历计算快线EMA、慢线EMA和信号线（EMA递推，与ewm(adjust=False)一致），close不能为空"""
+    alpha_fast = 2.0 / (fast_period + 1)
+    alpha_slow = 2.0 / (slow_period + 1)
+    alpha_signal = 2.0 / (signal_period + 1)
+    
+    ema_fast = close[0]
+    ema_slow = close[0]
+    signal = 0.0
+    for i in range(1, close.shape[0]):
+        ema_fast = alpha_fast * close[i] + (1.0 - alpha_fast) * ema_fast
+        ema_slow = alpha_slow * close[i] + (1.0 - alpha_slow) * ema_slow
+        signal = alpha_signal * (ema_fast - ema_slow) + (1.0 - alpha_signal) * signal
+    
+    return ema_fast, ema_slow, signal
+
+@njit(cache=True)
+def _macd_last(close, fast_period, slow_period, signal_period):
+    """计算最后一根K线的MACD"""
+    if close.shape[0] == 0:
+        return np.nan, np.nan, np.nan
+    
+    ema_fast, ema_slow, signal = _macd_state(close, fast_period, slow_period, signal_period)
+    macd = ema_fast - ema_slow
+    return macd, signal, macd - signal
+
+@njit(cache=True)
+def _bb_last(close, period, num_std):
+    """计算最后一根K线的布林带（样本标准差，与rolling(period).std()一致）"""
+    n = close.shape[0]
+    if n < period or period < 2:
+        return np.nan, np.nan, np.nan
+    
+    total = 0.0
+    for i in range(n - period, n):
+        total += close[i]
+    middle = total / period
+    
+    sq_sum = 0.0
+    for i in range(n - period, n):
+        diff = close[i] - middle
+        sq_sum += diff * diff
+    std = np.sqrt(sq_sum / (period - 1))
+    
+    return middle + std * num_std, middle, middle - std * num_std
+
+# 增量指标参数
+_RSI_PERIOD = 14
+_MACD_FAST, _MACD_SLOW, _MACD_SIGNAL = 12, 26, 9
+_BB_PERIOD = 20
+_BB_NUM_STD = 2.0
+
+# EMA平滑系数只计算一次
+_ALPHA_FAST = 2.0 / (_MACD_FAST + 1)
+_ALPHA_SLOW = 2.0 / (_MACD_SLOW + 1)
+_ALPHA_SIGNAL = 2.0 / (_MACD_SIGNAL + 1)
+
+# 状态中保留的已收盘收盘价数量：布林带需要period-1根，简单平均RSI需要period根，再加上未收盘K线
+_STATE_WINDOW = max(_BB_PERIOD - 1, _RSI_PERIOD)
+
+@dataclass(slots=True)
+class IndicatorState:
+    """
+    单个交易对、周期的增量指标状态
+    
+    只记录已收盘K线：首次使用时由指标内核对已有K线一次算出初始状态，之后每根新K线以O(1)递推更新；
+    未收盘的最新K线仅参与结果计算，不写入状态。递推公式与内核一致，结果与在完整历史上计算相同。
+    Wilder平滑的RSI在预热期内avg_gain/avg_loss保存涨跌幅累计和，满period个差值后转为平均值。
+    """
+    rsi_smoothing: str = "wilder"
+    last_ts: object = None
+    last_close: float = np.nan
+    count: int = 0
+    ema_fast: float = np.nan
+    ema_slow: float = np.nan
+    macd_signal: float = 0.0
+    avg_gain: float = 0.0
+    avg_loss: float = 0.0
+    window: deque = field(default_factory=lambda: deque(maxlen=_STATE_WINDOW))
+    
+    @classmethod
+    def from_history(cls, timestamps: np.ndarray, closes: np.ndarray, rsi_smoothing: str = "wilder") -> "IndicatorState":
+        """
+        由已收盘K线建立状态，使用与_calculate_*相同的指标内核
+        
+        Args:
+            timestamps: 已收盘K线的时间
+            closes: 已收盘K线的收盘价
+            rsi_smoothing: RSI平滑方式
+            
+        Returns:
+            IndicatorState: 指标状态
+        """
+        state = cls(rsi_smoothing=rsi_smoothing)
+        if closes.shape[0] == 0:
+            return state
+        
+        state.ema_fast, state.ema_slow, state.macd_signal = map(
+            float, _macd_state(closes, _MACD_FAST, _MACD_SLOW, _MACD_SIGNAL)
+        )
+        state.avg_gain, state.avg_loss = map(float, _wilder_averages(closes, _RSI_PERIOD))
+        state.window.extend(_tail(closes, _STATE_WINDOW).tolist())
+        state.last_close = float(closes[-1])
+        state.last_ts = timestamps[-1]
+        state.count = closes.shape[0]
+        return state
+    
+    def _step(self, close: float) -> Tuple[float, float, float, float, float]:
+        """计算加入close后的(ema_fast, ema_slow, macd_signal, avg_gain, avg_loss)，不修改状态"""
+        if self.count == 0:
+            return close, close, 0.0, 0.0, 0.0
+        
+        ema_fast = _ALPHA_FAST * close + (1.0 - _ALPHA_FAST) * self.ema_fast
+        ema_slow = _ALPHA_SLOW * close + (1.0 - _ALPHA_SLOW) * self.ema_slow
+        macd_signal = _ALPHA_SIGNAL * (ema_fast - ema_slow) + (1.0 - _ALPHA_SIGNAL) * self.macd_signal
+        
+        delta = close - self.last_close
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        # 加入close后的差值个数为count
+        if self.count <= _RSI_PERIOD:
+            avg_gain, avg_loss = self.avg_gain + gain, self.avg_loss + loss
+            if self.count == _RSI_PERIOD:
+                avg_gain /= _RSI_PERIOD
+                avg_loss /= _RSI_PERIOD
+        else:
+            avg_gain = (self.avg_gain * (_RSI_PERIOD - 1) + gain) / _RSI_PERIOD
+            avg_loss = (self.avg_loss * (_RSI_PERIOD - 1) + loss) / _RSI_PERIOD
+        
+        return ema_fast, ema_slow, macd_signal, avg_gain, avg_loss
+    
+    def update(self, ts, close: float) -> None:
+        """写入一根已收盘K线"""
+        self.ema_fast, self.ema_slow, self.macd_signal, self.avg_gain, self.avg_loss = self._step(close)
+        self.window.append(close)
+        self.last_close = close
+        self.last_ts = ts
+        self.count += 1
+    
+    def results(self, close: float) -> Dict:
+        """
+        以close作为最新K线收盘价计算各指标结果
+        
+        Args:
+            close: 最新（可能未收盘）K线的收盘价
+            
+        Returns:
+            Dict: 指标名称到指标结果的映射
+        """
+        ema_fast, ema_slow, macd_signal, avg_gain, avg_loss = self._step(close)
+        
+        # 最近的收盘价加上未收盘K线，供简单平均RSI和布林带使用
+        recent = np.fromiter(self.window, dtype=np.float64, count=len(self.window))
+        recent = np.append(recent, close)
+        
+        # RSI
+        if self.rsi_smoothing == "sma":
+            rsi = float(_rsi_last(_tail(recent, _RSI_PERIOD + 1), _RSI_PERIOD))
+        elif self.count < _RSI_PERIOD:
+            rsi = np.nan
+        else:
+            rsi = float(_rsi_from_averages(avg_gain, avg_loss))
+        
+        # MACD
+        macd = ema_fast - ema_slow
+        hist = macd - macd_signal
+        
+        # 布林带
+        upper, middle, lower = map(float, _bb_last(_tail(recent, _BB_PERIOD), _BB_PERIOD, _BB_NUM_STD))
+        
+        return {
+            "RSI": RSIResult(rsi=rsi, is_overbought=rsi > 70, is_oversold=rsi < 30),
+            "MACD": MACDResult(macd=macd, signal=macd_signal, hist=hist,
+                               is_bullish=hist > 0, is_bearish=hist < 0),
+            "BB": BBResult(upper=upper, middle=middle, lower=lower,
+                           is_overbought=close > upper, is_oversold=close < lower)
+        }
+
 class MarketAnalyzer:
     """市场分析类"""
     
@@ -27,20 +331,44 @@ class MarketAnalyzer:
         self.symbols = self.config.get("symbols", ["BTC/USDT"])
         self.timeframes = self.config.get("timeframes", ["1h"])
         self.indicators = self.config.get("indicators", ["RSI", "MACD", "BB"])
+        # RSI平滑方式: "wilder"为Wilder平滑（默认），"sma"为涨跌幅的简单移动平均（与早期版本结果一致）
+        self.rsi_smoothing = self.config.get("rsi_smoothing", "wilder")
+        # 是否跨调用保留增量指标状态；关闭时每次调用都在获取到的K线上完整计算
+        self.incremental_indicators = self.config.get("incremental_indicators", True)
         
         # 初始化交易所客户端
         self.exchange_name = os.getenv("EXCHANGE", "binance")
         self.exchange = ExchangeClient(self.exchange_name)
         
+        # 并发请求控制
+        self.max_workers = self.config.get("max_workers", 16)
+        self._request_semaphore = threading.BoundedSemaphore(self.config.get("max_concurrent_requests", 8))
+        self._price_lock = threading.Lock()
+        
+        # 指标缓存: (symbol, timeframe) -> (过期时间, 最新K线时间, 最新收盘价, 指标, 信号)
+        # 每个交易对、周期只保留最近一次的结果，条目数不超过交易对数×周期数，无需清理；
+        # 最新K线未变化时直接复用，省去指标计算和信号生成（关闭增量指标时为完整的内核计算）
+        self._cache: Dict[Tuple, Tuple[float, object, float, Dict, Dict]] = {}
+        self._cache_lock = threading.Lock()
+        
+        # 增量指标状态: (symbol, timeframe) -> IndicatorState
+        # 每个状态键使用独立的锁，不同交易对、周期的指标计算可以并行；_state_lock只保护锁的查找
+        self._indicator_state: Dict[Tuple, IndicatorState] = {}
+        self._state_key_locks: Dict[Tuple, threading.Lock] = defaultdict(threading.Lock)
+        self._state_lock = threading.Lock()
+        
         logger.info("初始化市场分析模块")
     
-    def analyze_market(self, symbol: str, timeframe: str = "1h") -> Dict:
+    def analyze_market(self, symbol: str, timeframe: str = "1h", price_cache: Optional[Dict] = None,
+                       timestamp: Optional[str] = None) -> Dict:
         """
         分析市场
         
         Args:
             symbol: 交易对名称
             timeframe: 时间周期
+            price_cache: 价格缓存，同一次汇总中相同交易对只请求一次当前价格
+            timestamp: 结果时间戳（ISO格式），为空时使用当前时间
             
         Returns:
             Dict: 分析结果
@@ -52,103 +380,188 @@ class MarketAnalyzer:
                 api_symbol = symbol.replace("/", "")
             
             # 获取K线数据
-            klines = self.exchange.get_klines(api_symbol, timeframe)
+            with self._request_semaphore:
+                klines = self.exchange.get_klines(api_symbol, timeframe)
             if klines.empty:
                 logger.error(f"获取{symbol} K线数据失败")
                 return {}
             
-            # 计算技术指标
-            indicators = self._calculate_indicators(klines)
+            # 最新K线的时间和收盘价都未变化时指标结果相同，直接复用缓存的指标和信号
+            cache_key = (symbol, timeframe)
+            last_ts, last_close = klines['timestamp'].to_numpy()[-1], float(_close_values(klines)[-1])
+            now = time.monotonic()
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
             
-            # 生成交易信号
-            signals = self._generate_signals(indicators)
+            if cached and now < cached[0] and cached[1] == last_ts and cached[2] == last_close:
+                indicators, signals = cached[3], cached[4]
+            else:
+                # 计算技术指标
+                state_key = (symbol, timeframe) if self.incremental_indicators else None
+                indicators = self._calculate_indicators(klines, state_key)
+                
+                # 生成交易信号
+                signals = self._generate_signals(indicators)
+                
+                # 缓存有效期为K线周期的1/4，覆盖该交易对、周期之前的结果
+                with self._cache_lock:
+                    self._cache[cache_key] = (now + _timeframe_seconds(timeframe) / 4, last_ts, last_close, indicators, signals)
             
-            # 获取当前价格
-            current_price = self.exchange.get_symbol_price(api_symbol)
+            # 当前价格和时间戳每次重新获取
+            current_price = self._get_symbol_price(api_symbol, price_cache)
             
-            return {
+            # 指标结果为不可变对象，信号中含列表需深拷贝，调用方修改返回结果不影响缓存
+            result = {
                 "symbol": symbol,
                 "timeframe": timeframe,
                 "current_price": current_price,
-                "indicators": indicators,
-                "signals": signals,
-                "timestamp": datetime.now().isoformat()
+                "indicators": dict(indicators),
+                "signals": copy.deepcopy(signals),
+                "timestamp": timestamp or datetime.now().isoformat()
             }
             
+            return result
+            
         except Exception as e:
             logger.error(f"分析{symbol}市场失败: {str(e)}")
             return {}
     
-    def _calculate_indicators(self, df: pd.DataFrame) -> Dict:
+    def _get_symbol_price(self, api_symbol: str, price_cache: Optional[Dict] = None) -> float:
+        """
+        获取当前价格，提供price_cache时对相同交易对只请求一次
+        
+        Args:
+            api_symbol: 交易所格式的交易对名称
+            price_cache: 价格缓存，值为Future
+            
+        Returns:
+            float: 当前价格
+        """
+        if price_cache is None:
+            with self._request_semaphore:
+                return self.exchange.get_symbol_price(api_symbol)
+        
+        with self._price_lock:
+            future = price_cache.get(api_symbol)
+            is_owner = future is None
+            if is_owner:
+                future = price_cache[api_symbol] = Future()
+        
+        if is_owner:
+            try:
+                with self._request_semaphore:
+                    future.set_result(self.exchange.get_symbol_price(api_symbol))
+            except Exception as e:
+                future.set_exception(e)
+        
+        return future.result()
+    
+    def _calculate_indicators(self, df: pd.DataFrame, state_key: Optional[Tuple] = None) -> Dict:
         """
         计算技术指标
         
         Args:
             df: K线数据DataFrame
+            state_key: 增量状态键(symbol, timeframe)，提供时只对新收盘的K线做增量更新，否则完整计算
             
         Returns:
             Dict: 技术指标数据
         """
+        if state_key is not None:
+            results = self._update_indicator_state(state_key, df)
+            return {name: results[name] for name in ("RSI", "MACD", "BB") if name in self.indicators}
+        
         indicators = {}
+        close = _close_values(df)
         
         # 计算RSI
         if "RSI" in self.indicators:
-            indicators["RSI"] = self._calculate_rsi(df)
+            indicators["RSI"] = self._calculate_rsi(close)
         
         # 计算MACD
         if "MACD" in self.indicators:
-            indicators["MACD"] = self._calculate_macd(df)
+            indicators["MACD"] = self._calculate_macd(close)
         
         # 计算布林带
         if "BB" in self.indicators:
-            indicators["BB"] = self._calculate_bollinger_bands(df)
+            indicators["BB"] = self._calculate_bollinger_bands(close)
         
         return indicators
     
-    def _calculate_rsi(self, df: pd.DataFrame, period: int = 14) -> Dict:
-        """计算RSI指标"""
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+    def _update_indicator_state(self, state_key: Tuple, df: pd.DataFrame) -> Dict:
+        """
+        将新收盘的K线写入增量状态，并以最新K线计算指标结果
         
-        return {
-            "rsi": rsi.iloc[-1],
-            "is_overbought": rsi.iloc[-1] > 70,
-            "is_oversold": rsi.iloc[-1] < 30
-        }
+        Args:
+            state_key: 状态键(symbol, timeframe)
+            df: K线数据DataFrame，最后一根视为未收盘
+            
+        Returns:
+            Dict: 指标名称到指标结果的映射
+        """
+        timestamps = df['timestamp'].to_numpy()
+        closes = _close_values(df)
+        
+        with self._state_lock:
+            key_lock = self._state_key_locks[state_key]
+        
+        with key_lock:
+            state = self._indicator_state.get(state_key)
+            
+            # 在已收盘K线中定位状态记录的最后一根K线；找不到（K线不连续）或其收盘价被修正时重建状态
+            start = -1
+            if state is not None and state.last_ts is not None:
+                idx = int(np.searchsorted(timestamps[:-1], state.last_ts, side='left'))
+                if idx < len(closes) - 1 and timestamps[idx] == state.last_ts and closes[idx] == state.last_close:
+                    start = idx + 1
+            
+            if start < 0:
+                state = self._indicator_state[state_key] = IndicatorState.from_history(
+                    timestamps[:-1], closes[:-1], self.rsi_smoothing
+                )
+            else:
+                for i in range(start, len(closes) - 1):
+                    state.update(timestamps[i], float(closes[i]))
+            
+            return state.results(float(closes[-1]))
     
-    def _calculate_macd(self, df: pd.DataFrame) -> Dict:
-        """计算MACD指标"""
-        exp1 = df['close'].ewm(span=12, adjust=False).mean()
-        exp2 = df['close'].ewm(span=26, adjust=False).mean()
-        macd = exp1 - exp2
-        signal = macd.ewm(span=9, adjust=False).mean()
-        hist = macd - signal
+    def _calculate_rsi(self, close: np.ndarray, period: int = _RSI_PERIOD) -> RSIResult:
+        """计算RSI指标，Wilder平滑依赖完整历史，简单平均只需最后period个差值"""
+        if self.rsi_smoothing == "sma":
+            rsi = float(_rsi_last(_tail(close, period + 1), period))
+        else:
+            rsi = float(_rsi_wilder_last(close, period))
         
-        return {
-            "macd": macd.iloc[-1],
-            "signal": signal.iloc[-1],
-            "hist": hist.iloc[-1],
-            "is_bullish": hist.iloc[-1] > 0,
-            "is_bearish": hist.iloc[-1] < 0
-        }
+        return RSIResult(
+            rsi=rsi,
+            is_overbought=rsi > 70,
+            is_oversold=rsi < 30
+        )
     
-    def _calculate_bollinger_bands(self, df: pd.DataFrame, period: int = 20) -> Dict:
-        """计算布林带指标"""
-        sma = df['close'].rolling(window=period).mean()
-        std = df['close'].rolling(window=period).std()
-        upper_band = sma + (std * 2)
-        lower_band = sma - (std * 2)
+    def _calculate_macd(self, close: np.ndarray) -> MACDResult:
+        """计算MACD指标，EMA递推依赖完整历史，使用全部K线以保证结果与完整计算一致"""
+        macd, signal, hist = map(float, _macd_last(close, _MACD_FAST, _MACD_SLOW, _MACD_SIGNAL))
         
-        return {
-            "upper": upper_band.iloc[-1],
-            "middle": sma.iloc[-1],
-            "lower": lower_band.iloc[-1],
-            "is_overbought": df['close'].iloc[-1] > upper_band.iloc[-1],
-            "is_oversold": df['close'].iloc[-1] < lower_band.iloc[-1]
-        }
+        return MACDResult(
+            macd=macd,
+            signal=signal,
+            hist=hist,
+            is_bullish=hist > 0,
+            is_bearish=hist < 0
+        )
+    
+    def _calculate_bollinger_bands(self, close: np.ndarray, period: int = _BB_PERIOD) -> BBResult:
+        """计算布林带指标，只需最后period根K线"""
+        upper_band, sma, lower_band = map(float, _bb_last(_tail(close, period), period, _BB_NUM_STD))
+        last_close = float(close[-1])
+        
+        return BBResult(
+            upper=upper_band,
+            middle=sma,
+            lower=lower_band,
+            is_overbought=last_close > upper_band,
+            is_oversold=last_close < lower_band
+        )
     
     def _generate_signals(self, indicators: Dict) -> Dict:
         """
@@ -160,50 +573,18 @@ class MarketAnalyzer:
         Returns:
             Dict: 交易信号
         """
-        signals = {
-            "buy": False,
-            "sell": False,
-            "strength": 0,
-            "reason": []
-        }
+        hits = [
+            (direction, reason)
+            for name, attr, direction, reason in _SIGNAL_RULES
+            if name in indicators and getattr(indicators[name], attr)
+        ]
         
-        # RSI信号
-        if "RSI" in indicators:
-            rsi = indicators["RSI"]
-            if rsi["is_oversold"]:
-                signals["buy"] = True
-                signals["strength"] += 1
-                signals["reason"].append("RSI超卖")
-            elif rsi["is_overbought"]:
-                signals["sell"] = True
-                signals["strength"] -= 1
-                signals["reason"].append("RSI超买")
-        
-        # MACD信号
-        if "MACD" in indicators:
-            macd = indicators["MACD"]
-            if macd["is_bullish"]:
-                signals["buy"] = True
-                signals["strength"] += 1
-                signals["reason"].append("MACD金叉")
-            elif macd["is_bearish"]:
-                signals["sell"] = True
-                signals["strength"] -= 1
-                signals["reason"].append("MACD死叉")
-        
-        # 布林带信号
-        if "BB" in indicators:
-            bb = indicators["BB"]
-            if bb["is_oversold"]:
-                signals["buy"] = True
-                signals["strength"] += 1
-                signals["reason"].append("价格触及布林带下轨")
-            elif bb["is_overbought"]:
-                signals["sell"] = True
-                signals["strength"] -= 1
-                signals["reason"].append("价格触及布林带上轨")
-        
-        return signals
+        return {
+            "buy": any(direction > 0 for direction, _ in hits),
+            "sell": any(direction < 0 for direction, _ in hits),
+            "strength": sum(direction for direction, _ in hits),
+            "reason": [reason for _, reason in hits]
+        }
     
     def get_market_summary(self) -> Dict:
         """
@@ -212,15 +593,32 @@ class MarketAnalyzer:
         Returns:
             Dict: 市场总结数据
         """
+        # 同一次汇总的所有结果共用一个时间戳
+        timestamp = datetime.now().isoformat()
         summary = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "symbols": {}
         }
         
+        tasks = [(symbol, timeframe) for symbol in self.symbols for timeframe in self.timeframes]
+        if not tasks:
+            return summary
+        
+        # 并发获取各交易对、各周期的分析结果
+        results = {}
+        price_cache = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+            futures = {
+                executor.submit(self.analyze_market, symbol, timeframe, price_cache, timestamp): (symbol, timeframe)
+                for symbol, timeframe in tasks
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
         for symbol in self.symbols:
             symbol_summary = {}
             for timeframe in self.timeframes:
-                analysis = self.analyze_market(symbol, timeframe)
+                analysis = results.get((symbol, timeframe))
                 if analysis:
                     symbol_summary[timeframe] = analysis
             
@@ -2,21 +2,46 @@ import pandas as pd
 import numpy as np
 import logging
 import re
+import json
 import time
-from datetime import datetime, timedelta
-from textblob import TextBlob
-import nltk
-from nltk.tokenize import word_tokenize
+import random
+import asyncio
+import queue
+import threading
+import heapq
+import copy
+import importlib.util
+from bisect import bisect_right
+import httpx
+from datetime import datetime, timedelta, timezone
+from textblob.en.sentiments import PatternAnalyzer
 from collections import Counter
+from itertools import chain, islice
+from functools import lru_cache
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import os
+import shutil
+import subprocess
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+except ImportError:
+    SentimentIntensityAnalyzer = None
 
 # 设置日志
 logging.basicConfig(
@@ -25,12 +50,267 @@ logging.basicConfig(
 )
 logger = logging.getLogger('social_analysis')
 
-# 确保NLTK的必要资源已下载
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    logger.info("下载NLTK punkt分词器...")
-    nltk.download('punkt', quiet=True)
+# Twitter API v2最近推文搜索接口，一次GET即可获取指定账号的推文及互动数据
+_TWITTER_SEARCH_URL = "https://api.twitter.com/2/tweets/search/recent"
+
+# Twitter API网络错误和5xx错误的重试次数及首次重试等待时间（秒，之后按指数增长）
+_API_MAX_RETRIES = 2
+_API_RETRY_DELAY = 1.0
+# 最近推文搜索接口单次请求的推文数量范围
+_API_MIN_RESULTS, _API_MAX_RESULTS = 10, 100
+# 限流响应未带重置时间时的默认等待时间（秒）
+_RATE_LIMIT_DEFAULT_WAIT = 60
+# HTTP/2需要h2包，未安装时使用HTTP/1.1
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# 文本清理正则：URL、@提及、特殊字符、数字合并为一次扫描
+# 提及在URL起始处截止，结果与依次执行四次替换一致
+_CLEAN_TEXT_RE = re.compile(r'http\S+|www\S+|@(?:(?!http\S|www\S)\w)+|[^\w\s]|\d+')
+
+# 在浏览器内一次提取页面上所有推文的[文本, 时间, 点赞数, 转发数]，避免逐元素的WebDriver往返
+_EXTRACT_TWEETS_JS = r"""
+return Array.from(document.querySelectorAll("article[data-testid='tweet']")).map(a => {
+    const text = a.querySelector("div[data-testid='tweetText']") || a.querySelector("div[lang]");
+    const time = a.querySelector("time");
+    const like = a.querySelector("div[data-testid='like']");
+    const retweet = a.querySelector("div[data-testid='retweet']");
+    const link = a.querySelector("a[href*='/status/']");
+    const status = link ? link.getAttribute("href").match(/\/status\/(\d+)/) : null;
+    return [
+        text ? text.innerText : null,
+        time ? time.getAttribute("datetime") : null,
+        like ? like.innerText : "0",
+        retweet ? retweet.innerText : "0",
+        status ? status[1] : null
+    ];
+});
+"""
+
+# 登录和抓取流程中多处使用的页面元素定位器
+_TWEET_ARTICLE_LOCATOR = (By.CSS_SELECTOR, "article[data-testid='tweet']")
+_TEXT_INPUT_LOCATOR = (By.NAME, "text")
+_PASSWORD_LOCATOR = (By.NAME, "password")
+_NEXT_TEXT_LOCATOR = (By.XPATH, "//span[text()='Next']")
+_NEXT_BUTTON_LOCATOR = (By.CSS_SELECTOR, "div[data-testid='ocfEnterTextNextButton']")
+_ROLE_BUTTON_LOCATOR = (By.XPATH, "//div[@role='button']")
+_HOME_LINK_LOCATOR = (By.CSS_SELECTOR, "a[data-testid='AppTabBar_Home_Link']")
+
+# 保存登录Cookie时保留的字段（add_cookie只接受这些字段）
+_COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'expiry', 'secure', 'httpOnly', 'sameSite')
+
+# 推文互动数量正则及单位倍数
+_COUNT_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([KkMmBb]?)')
+_COUNT_UNITS = {'': 1, 'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+
+# 话题分词正则：清理后的文本只含单词字符和空白，按空白切分并保留长度大于2的词
+_WORD_RE = re.compile(r'\w{3,}')
+
+# 摘要热门话题分词正则：保留长度大于3的词
+_SUMMARY_WORD_RE = re.compile(r'\w{4,}')
+
+# 话题统计时忽略的停用词
+_STOP_WORDS = frozenset([
+    'the', 'a', 'an', 'and', 'or', 'but', 'is', 'are', 'was',
+    'were', 'to', 'of', 'in', 'for', 'with', 'by', 'at', 'on'
+])
+
+# 市场洞察文案：分数落在bounds划分的第i个区间（含左端点）时使用第i条
+_SENTIMENT_INSIGHT_BOUNDS = (-0.5, -0.2, 0.2, 0.5)
+_SENTIMENT_INSIGHTS = (
+    "整体情绪十分消极，市场可能处于悲观状态。",
+    "整体情绪偏消极，市场可能存在担忧。",
+    "整体情绪中性，市场情绪稳定。",
+    "整体情绪偏积极，市场情绪良好。",
+    "整体情绪十分积极，市场可能处于乐观状态。"
+)
+_IMPORTANT_INSIGHT_BOUNDS = (0.1, 0.3)
+_IMPORTANT_INSIGHTS = (
+    "未发现重要消息，市场可能维持目前趋势。",
+    "有少量重要消息发布，可能会影响部分币种表现。",
+    "有大量重要消息发布，需密切关注市场反应。"
+)
+
+# 情感类别编码对应的名称：0中性、1积极、2消极
+_SENTIMENT_LABELS = ('neutral', 'positive', 'negative')
+
+def _classify_sentiment(scores: np.ndarray, positive: float, negative: float) -> Tuple[np.ndarray, int, int]:
+    """按阈值向量化划分情感类别，返回(类别编码数组, 积极数量, 消极数量)"""
+    codes = np.select([scores >= positive, scores <= negative], [1, 2], default=0).astype(np.int8)
+    return codes, int(np.count_nonzero(codes == 1)), int(np.count_nonzero(codes == 2))
+
+def _push_top(heap: list, size: int, entry: Tuple) -> None:
+    """向最小堆中加入元素，堆中只保留最大的size个"""
+    if len(heap) < size:
+        heapq.heappush(heap, entry)
+    else:
+        heapq.heappushpop(heap, entry)
+
+def _parse_tweet_time(value: Optional[str]) -> np.datetime64:
+    """解析单个推文时间，无法解析时返回NaT"""
+    try:
+        return np.datetime64(value[:19], 's')
+    except (TypeError, ValueError):
+        return np.datetime64('NaT', 's')
+
+def _parse_tweet_times(values: List[Optional[str]], default: np.datetime64) -> np.ndarray:
+    """
+    批量解析推文时间
+    
+    Twitter页面和API返回的时间均为UTC（如2024-01-01T10:00:00.000Z），截取到秒后一次转换为datetime64数组。
+    
+    Args:
+        values: ISO格式时间字符串列表，可包含None
+        default: 缺失或无法解析的时间使用的默认值
+        
+    Returns:
+        np.ndarray: datetime64[s]数组（UTC）
+    """
+    try:
+        times = np.array([value[:19] if value else 'NaT' for value in values], dtype='datetime64[s]')
+    except ValueError:
+        # 存在格式异常的时间时逐个解析
+        times = np.array([_parse_tweet_time(value) for value in values], dtype='datetime64[s]')
+    times[np.isnat(times)] = default
+    return times
+
+def _localize_created_at(tweets: List[Dict]) -> List[Dict]:
+    """
+    将推文的created_at（UTC ISO时间字符串）批量转换为本地时间的datetime
+    
+    缺失或无法解析的时间使用当前时间，与模拟推文一致，所有推文的created_at都是不带时区的本地时间。
+    
+    Args:
+        tweets: 推文列表，原地修改
+        
+    Returns:
+        list: 推文列表
+    """
+    if not tweets:
+        return tweets
+    
+    now = datetime.now().astimezone()
+    now_utc = np.datetime64(now.astimezone(timezone.utc).replace(tzinfo=None), 's')
+    local_offset = np.timedelta64(int(now.utcoffset().total_seconds()), 's')
+    times = _parse_tweet_times([tweet.get('created_at') for tweet in tweets], now_utc) + local_offset
+    for tweet, created_at in zip(tweets, times.tolist()):
+        tweet['created_at'] = created_at
+    return tweets
+
+# 模拟的币安推文：(发布于多少小时前, 推文内容)
+_MOCK_BINANCE_TWEETS = (
+    (2, {
+        'id': '1',
+        'text': 'We are excited to announce a new listing on Binance: XYZ Token (XYZ)!',
+        'user': 'binance',
+        'favorite_count': 530,
+        'retweet_count': 210,
+        'sentiment_score': 0.75,
+        'sentiment': 'positive',
+        'important_keywords': ('listing', 'announcement')
+    }),
+    (5, {
+        'id': '2',
+        'text': 'Market update: Bitcoin has shown strong resilience in the past 24 hours.',
+        'user': 'BinanceResearch',
+        'favorite_count': 320,
+        'retweet_count': 95,
+        'sentiment_score': 0.45,
+        'sentiment': 'neutral',
+        'important_keywords': ('update',)
+    }),
+    (10, {
+        'id': '3',
+        'text': 'Warning: Beware of phishing attempts. Always verify you are on the official Binance website.',
+        'user': 'cz_binance',
+        'favorite_count': 850,
+        'retweet_count': 420,
+        'sentiment_score': -0.2,
+        'sentiment': 'neutral',
+        'important_keywords': ()
+    })
+)
+
+# 模拟分析结果的缓存时间（秒），期间重复轮询直接返回同一结果
+_MOCK_CACHE_SECONDS = 60
+
+# 模拟分析使用的热门话题和新闻模板
+_MOCK_TOPICS = (
+    "价格上涨", "价格下跌", "新合作", "技术更新",
+    "监管消息", "交易量增加", "市场波动", "鲸鱼活动",
+    "社区活动", "行业新闻", "竞争对手", "宏观经济"
+)
+_MOCK_NEWS_TEMPLATES = (
+    "{currency}价格在过去24小时内上涨超过5%",
+    "{currency}开发团队宣布重要技术突破",
+    "大型交易所宣布支持{currency}",
+    "{currency}社区投票通过新提案",
+    "分析师预测{currency}价格走势看好",
+    "市场对{currency}的兴趣增加",
+    "{currency}交易量创新高",
+    "知名投资者增持{currency}"
+)
+
+# 同一推文会在多次分析和多个交易对之间重复出现，按原文缓存清理、情感和分词结果
+@lru_cache(maxsize=8192)
+def _clean_text_cached(text: str) -> str:
+    """清理文本（带缓存）"""
+    return _CLEAN_TEXT_RE.sub('', text).lower()
+
+# TextBlob默认的情感分析器，直接调用可省去每次构造TextBlob对象的开销
+_SENTIMENT_ANALYZER = PatternAnalyzer()
+
+@lru_cache(maxsize=8192)
+def _sentiment_polarity(text: str) -> float:
+    """计算推文的TextBlob情感极性（带缓存）"""
+    return _SENTIMENT_ANALYZER.analyze(_clean_text_cached(text)).polarity
+
+@lru_cache(maxsize=1)
+def _get_vader_analyzer():
+    """创建VADER情感分析器，词典只在首次使用时加载一次"""
+    return SentimentIntensityAnalyzer()
+
+@lru_cache(maxsize=8192)
+def _vader_compound(text: str) -> float:
+    """计算推文的VADER综合情感分数（带缓存），VADER依赖标点和大小写，直接使用原文"""
+    return _get_vader_analyzer().polarity_scores(text)['compound']
+
+@lru_cache(maxsize=8192)
+def _topic_tokens_cached(text: str) -> Tuple[str, ...]:
+    """对清理后的推文分词并去除停用词（带缓存），返回元组以免调用方修改缓存内容"""
+    return tuple(word for word in _WORD_RE.findall(_clean_text_cached(text)) if word not in _STOP_WORDS)
+
+@lru_cache(maxsize=8192)
+def _summary_tokens_cached(text: str) -> Tuple[str, ...]:
+    """提取摘要热门话题使用的词（带缓存），多个交易对共用同一账号时不重复分词"""
+    return tuple(_SUMMARY_WORD_RE.findall(_clean_text_cached(text)))
+
+@lru_cache(maxsize=1)
+def _detect_browser() -> Tuple[Optional[str], Optional[str]]:
+    """
+    检测系统安装的Chrome/Chromium浏览器及版本，结果在进程内缓存
+    
+    Returns:
+        Tuple: (浏览器名称, 版本号)，未检测到时为(None, None)
+    """
+    for name, executable in (("Chrome", "google-chrome"), ("Chromium", "chromium-browser")):
+        if shutil.which(executable):
+            try:
+                output = subprocess.run([executable, "--version"], capture_output=True, text=True, timeout=10).stdout
+                return name, output.strip().split()[-1]
+            except (OSError, subprocess.SubprocessError, IndexError):
+                return name, None
+    return None, None
+
+@lru_cache(maxsize=1)
+def _install_chromedriver() -> str:
+    """通过webdriver-manager安装ChromeDriver并返回驱动路径，成功后在进程内缓存"""
+    # 避免使用缓存目录，直接下载到当前目录
+    os.environ["WDM_LOCAL"] = "1"
+    driver_path = ChromeDriverManager().install()
+    
+    # 确保驱动程序有执行权限
+    os.chmod(driver_path, os.stat(driver_path).st_mode | 0o111)
+    return driver_path
 
 class SocialMediaAnalyzer:
     """社交媒体分析类"""
@@ -45,16 +325,42 @@ class SocialMediaAnalyzer:
         self.config = config or {}
         self.twitter_accounts = self.config.get("twitter_accounts", [])
         self.important_keywords = self.config.get("important_keywords", [])
+        
+        # 账户名预先转为小写，按货币名匹配相关账户时无需重复转换
+        self._accounts_lower = [(account, account.lower()) for account in self.twitter_accounts]
+        
+        # 关键词预先转为小写，并构建多模式匹配自动机
+        self._keywords_lower = [(keyword, keyword.lower()) for keyword in self.important_keywords]
+        self._keyword_automaton = self._build_keyword_automaton()
+        self._keyword_regex = self._build_keyword_regex()
         self.sentiment_threshold = self.config.get("sentiment_threshold", {
             "positive": 0.6,
             "negative": -0.3
         })
         
+        # 情感分析引擎：textblob（默认）或vader，未安装vaderSentiment时回退为textblob
+        self.sentiment_engine = self.config.get("sentiment_engine", "textblob")
+        if self.sentiment_engine == "vader" and SentimentIntensityAnalyzer is None:
+            logger.warning("未安装vaderSentiment，情感分析回退为TextBlob")
+            self.sentiment_engine = "textblob"
+        
         # 模拟模式设置
         self.simulation_mode = self.config.get("simulation_mode", False)
         
-        # 初始化Twitter登录
+        # 初始化Twitter登录，self.driver为浏览器池中的第一个实例
         self.driver = None
+        self.driver_pool_size = self.config.get("driver_pool_size", 3)
+        self._drivers = []
+        self._driver_pool = queue.Queue()
+        self._mock_symbol_cache = {}  # 交易对 -> (过期时间, 模拟分析结果)
+        self.cookie_file = self.config.get("cookie_file", "data/twitter_cookies.json")  # 登录Cookie保存路径，为空时不保存
+        
+        # 配置了Bearer Token时直接通过Twitter API获取推文，无需启动浏览器（use_selenium为True时仍使用浏览器）
+        self.bearer_token = os.getenv("TWITTER_BEARER_TOKEN")
+        self.use_api = bool(self.bearer_token) and not self.config.get("use_selenium", False)
+        self.max_concurrent_requests = self.config.get("max_concurrent_requests", 5)
+        self._rate_limited_until = 0.0  # Twitter API限流解除时间（Unix时间戳）
+        self._rate_limit_lock = threading.Lock()  # 并发请求（线程池和事件循环）共享限流时间
         
         # 从环境变量读取模拟模式标志
         simulation_env = os.getenv("SOCIAL_SIMULATION_MODE", "").lower()
@@ -65,21 +371,24 @@ class SocialMediaAnalyzer:
         # 检查Twitter登录凭证
         email = os.getenv("TWITTER_EMAIL")
         password = os.getenv("TWITTER_PASSWORD")
-        if not email or not password:
+        if not self.use_api and (not email or not password):
             logger.warning("Twitter登录凭证不完整，启用社交媒体分析模拟模式")
             self.simulation_mode = True
         
-        # 如果不使用模拟模式，尝试登录Twitter
+        # 如果不使用模拟模式，优先使用Twitter API，否则尝试登录Twitter
         if not self.simulation_mode:
-            logger.info("尝试连接到真实Twitter...")
-            self.init_twitter_login()
+            if self.use_api:
+                logger.info("使用Twitter API获取推文")
+            else:
+                logger.info("尝试连接到真实Twitter...")
+                self.init_twitter_login()
         else:
             logger.info("使用模拟模式，不连接真实Twitter")
         
         logger.info("社交媒体分析模块初始化完成")
     
     def init_twitter_login(self):
-        """初始化Twitter登录"""
+        """初始化Twitter登录，创建driver_pool_size个已登录的浏览器实例"""
         try:
             # 获取Twitter登录凭证
             email = os.getenv("TWITTER_EMAIL")
@@ -89,228 +398,305 @@ class SocialMediaAnalyzer:
                 logger.warning("Twitter登录凭证不完整，社交媒体分析将使用模拟数据")
                 return
             
+            for _ in range(self.driver_pool_size):
+                driver = self._create_driver(email, password)
+                if driver is None:
+                    break
+                self._drivers.append(driver)
+                self._driver_pool.put(driver)
+            
+            if self._drivers:
+                self.driver = self._drivers[0]
+                logger.info(f"Twitter登录成功，浏览器池大小: {len(self._drivers)}")
+            
+        except Exception as e:
+            logger.error(f"初始化Twitter登录失败: {str(e)}")
+    
+    def _create_driver(self, email, password):
+        """
+        创建并登录一个浏览器实例
+        
+        Args:
+            email: Twitter登录邮箱
+            password: Twitter登录密码
+            
+        Returns:
+            WebDriver: 已登录的浏览器实例，失败时返回None
+        """
+        driver = None
+        try:
+            # 设置Chrome选项
+            chrome_options = Options()
+            chrome_options.add_argument("--headless")  # 无头模式
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--window-size=1920,1080")  # 设置窗口大小
+            
+            # 解决自动化检测问题
+            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            chrome_options.add_experimental_option("useAutomationExtension", False)
+            
+            # 兼容Linux环境
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-software-rasterizer")
+            
+            # 添加用户代理
+            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
+            
+            # 尝试使用直接的ChromeDriver路径
             try:
-                # 设置Chrome选项
-                chrome_options = Options()
-                chrome_options.add_argument("--headless")  # 无头模式
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--disable-dev-shm-usage")
-                chrome_options.add_argument("--disable-gpu")
-                chrome_options.add_argument("--window-size=1920,1080")  # 设置窗口大小
-                
-                # 解决自动化检测问题
-                chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-                chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                chrome_options.add_experimental_option("useAutomationExtension", False)
-                
-                # 兼容Linux环境
-                chrome_options.add_argument("--disable-extensions")
-                chrome_options.add_argument("--disable-software-rasterizer")
+                # 首先检查系统是否安装了Chrome浏览器
+                browser, version = _detect_browser()
+                if browser:
+                    logger.info(f"检测到{browser}版本: {version}")
+                else:
+                    logger.warning("未检测到Chrome或Chromium浏览器")
                 
-                # 添加用户代理
-                chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
+                # 尝试直接使用系统Chrome
+                logger.info("尝试直接初始化Chrome...")
+                driver = webdriver.Chrome(options=chrome_options)
+            except Exception as e1:
+                logger.warning(f"直接初始化Chrome失败: {str(e1)}，尝试使用webdriver-manager")
                 
-                # 尝试使用直接的ChromeDriver路径
+                # 尝试使用webdriver-manager
                 try:
-                    # 首先检查系统是否安装了Chrome浏览器
-                    if os.system("which google-chrome") == 0:
-                        version_cmd = "google-chrome --version"
-                        version = os.popen(version_cmd).read().strip().split()[-1]
-                        logger.info(f"检测到Chrome版本: {version}")
-                    elif os.system("which chromium-browser") == 0:
-                        version_cmd = "chromium-browser --version"
-                        version = os.popen(version_cmd).read().strip().split()[-1]
-                        logger.info(f"检测到Chromium版本: {version}")
-                    else:
-                        logger.warning("未检测到Chrome或Chromium浏览器")
-                    
-                    # 尝试直接使用系统Chrome
-                    logger.info("尝试直接初始化Chrome...")
-                    self.driver = webdriver.Chrome(options=chrome_options)
-                except Exception as e1:
-                    logger.warning(f"直接初始化Chrome失败: {str(e1)}，尝试使用webdriver-manager")
+                    driver_path = _install_chromedriver()
+                    service = Service(driver_path)
+                    logger.info(f"使用WebDriver Manager安装的驱动: {driver_path}")
+                    driver = webdriver.Chrome(service=service, options=chrome_options)
+                except Exception as e2:
+                    logger.error(f"使用webdriver-manager初始化Chrome失败: {str(e2)}")
                     
-                    # 尝试使用webdriver-manager
-                    try:
-                        # 避免使用缓存目录，直接下载到当前目录
-                        os.environ["WDM_LOCAL"] = "1"
-                        
-                        from webdriver_manager.chrome import ChromeDriverManager
-                        driver_path = ChromeDriverManager().install()
-                        
-                        # 确保驱动程序有执行权限
-                        os.system(f"chmod +x {driver_path}")
-                        
-                        service = Service(driver_path)
-                        logger.info(f"使用WebDriver Manager安装的驱动: {driver_path}")
-                        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                    except Exception as e2:
-                        logger.error(f"使用webdriver-manager初始化Chrome失败: {str(e2)}")
-                        
-                        # 最后尝试使用模拟分析
-                        logger.warning("无法初始化浏览器，将使用模拟社交媒体分析")
-                        self.driver = None
-                        return
-                
-                # 登录Twitter
-                if self._login_twitter(email, password):
-                    logger.info("Twitter登录成功")
-                else:
-                    logger.warning("Twitter登录失败，将使用模拟社交媒体分析")
-                    self.driver.quit()
-                    self.driver = None
-                
-            except Exception as e:
-                logger.error(f"初始化Twitter浏览器失败: {str(e)}")
-                self.driver = None
+                    # 最后尝试使用模拟分析
+                    logger.warning("无法初始化浏览器，将使用模拟社交媒体分析")
+                    return None
+            
+            # 优先使用保存的登录Cookie，失效时再走完整登录流程
+            if self._restore_cookies(driver):
+                return driver
+            
+            # 登录Twitter
+            if self._login_twitter(driver, email, password):
+                self._save_cookies(driver)
+                return driver
+            
+            logger.warning("Twitter登录失败，将使用模拟社交媒体分析")
+            driver.quit()
+            return None
             
         except Exception as e:
-            logger.error(f"初始化Twitter登录失败: {str(e)}")
-            self.driver = None
+            logger.error(f"初始化Twitter浏览器失败: {str(e)}")
+            if driver is not None:
+                driver.quit()
+            return None
+    
+    def _restore_cookies(self, driver):
+        """
+        加载保存的登录Cookie并确认登录状态
+        
+        Args:
+            driver: 浏览器实例
+            
+        Returns:
+            bool: Cookie有效、已处于登录状态时返回True
+        """
+        if not self.cookie_file or not os.path.exists(self.cookie_file):
+            return False
+        
+        try:
+            with open(self.cookie_file, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+            
+            # 需要先打开同域页面才能写入Cookie
+            driver.get("https://twitter.com")
+            for cookie in cookies:
+                driver.add_cookie(cookie)
+            
+            driver.get("https://twitter.com/home")
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located(_HOME_LINK_LOCATOR))
+            logger.info("使用已保存的Cookie登录Twitter成功")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"使用已保存的Cookie登录失败: {str(e)}，将重新登录")
+            try:
+                driver.delete_all_cookies()
+            except Exception:
+                pass
+            return False
     
-    def _login_twitter(self, email, password):
-        """登录Twitter"""
+    def _save_cookies(self, driver):
+        """
+        保存登录Cookie，下次启动时可跳过登录流程
+        
+        Args:
+            driver: 已登录的浏览器实例
+        """
+        if not self.cookie_file:
+            return
+        
+        try:
+            cookies = [
+                {key: cookie[key] for key in _COOKIE_FIELDS if key in cookie}
+                for cookie in driver.get_cookies()
+            ]
+            
+            directory = os.path.dirname(self.cookie_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            # Cookie相当于登录凭证，只允许当前用户读写
+            fd = os.open(self.cookie_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cookies, f)
+            logger.info(f"Twitter登录Cookie已保存到: {self.cookie_file}")
+            
+        except Exception as e:
+            logger.error(f"保存Twitter登录Cookie失败: {str(e)}")
+    
+    def _login_twitter(self, driver, email, password):
+        """使用指定浏览器实例登录Twitter"""
         try:
             logger.info("开始Twitter登录流程...")
             
             # 访问Twitter登录页面
-            self.driver.get("https://twitter.com/i/flow/login")
+            driver.get("https://twitter.com/i/flow/login")
             logger.info("已打开Twitter登录页面，等待加载...")
-            time.sleep(5)  # 等待页面完全加载
+            # 等待页面完全加载
+            WebDriverWait(driver, 10).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
             
             # 移除navigator.webdriver属性以绕过机器人检测
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
             # 输入邮箱
             try:
                 logger.info("尝试查找邮箱输入框...")
                 # 多种定位方式
                 try:
-                    email_input = WebDriverWait(self.driver, 15).until(
+                    email_input = WebDriverWait(driver, 15).until(
                         EC.presence_of_element_located((By.XPATH, "//input[@autocomplete='username']"))
                     )
                 except:
                     try:
-                        email_input = WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.NAME, "text"))
+                        email_input = WebDriverWait(driver, 10).until(
+                            EC.presence_of_element_located(_TEXT_INPUT_LOCATOR)
                         )
                     except:
-                        email_input = WebDriverWait(self.driver, 10).until(
+                        email_input = WebDriverWait(driver, 10).until(
                             EC.presence_of_element_located((By.CSS_SELECTOR, "input[data-testid='ocfEnterTextTextInput']"))
                         )
                 
                 logger.info("找到邮箱输入框，输入邮箱...")
                 email_input.clear()
-                # 模拟人工输入
-                for char in email:
-                    email_input.send_keys(char)
-                    time.sleep(0.1)  # 模拟人工输入的时间间隔
-                
-                time.sleep(1)
+                email_input.send_keys(email)
                 
                 # 多种方式尝试点击下一步按钮
                 try:
-                    next_button = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.XPATH, "//span[text()='Next']"))
+                    next_button = WebDriverWait(driver, 10).until(
+                        EC.element_to_be_clickable(_NEXT_TEXT_LOCATOR)
                     )
                     next_button.click()
                 except:
                     try:
-                        next_button = WebDriverWait(self.driver, 10).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, "div[data-testid='ocfEnterTextNextButton']"))
+                        next_button = WebDriverWait(driver, 10).until(
+                            EC.element_to_be_clickable(_NEXT_BUTTON_LOCATOR)
                         )
                         next_button.click()
                     except:
                         # 尝试JavaScript点击
-                        next_buttons = self.driver.find_elements(By.XPATH, "//div[@role='button']")
+                        next_buttons = driver.find_elements(*_ROLE_BUTTON_LOCATOR)
                         for button in next_buttons:
                             if "next" in button.text.lower() or "下一步" in button.text:
-                                self.driver.execute_script("arguments[0].click();", button)
+                                driver.execute_script("arguments[0].click();", button)
                                 break
                 
                 logger.info("已点击下一步按钮，等待密码输入框...")
-                time.sleep(3)  # 等待转到密码页面
+                # 等待离开邮箱页面（邮箱输入框失效或密码输入框出现）
+                try:
+                    WebDriverWait(driver, 10).until(EC.any_of(
+                        EC.staleness_of(email_input),
+                        EC.presence_of_element_located(_PASSWORD_LOCATOR)
+                    ))
+                except TimeoutException:
+                    logger.warning("等待密码页面超时，尝试继续...")
                 
                 # 可能需要输入用户名
                 try:
-                    username_input = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.NAME, "text"))
+                    username_input = WebDriverWait(driver, 5).until(
+                        EC.presence_of_element_located(_TEXT_INPUT_LOCATOR)
                     )
                     logger.info("检测到需要输入用户名...")
                     username = email.split('@')[0]  # 使用邮箱前缀作为用户名
                     username_input.clear()
-                    for char in username:
-                        username_input.send_keys(char)
-                        time.sleep(0.1)
+                    username_input.send_keys(username)
                     
                     # 点击下一步
                     try:
-                        next_button = WebDriverWait(self.driver, 10).until(
-                            EC.element_to_be_clickable((By.XPATH, "//span[text()='Next']"))
+                        next_button = WebDriverWait(driver, 10).until(
+                            EC.element_to_be_clickable(_NEXT_TEXT_LOCATOR)
                         )
                         next_button.click()
                     except:
                         try:
-                            next_button = WebDriverWait(self.driver, 10).until(
-                                EC.element_to_be_clickable((By.CSS_SELECTOR, "div[data-testid='ocfEnterTextNextButton']"))
+                            next_button = WebDriverWait(driver, 10).until(
+                                EC.element_to_be_clickable(_NEXT_BUTTON_LOCATOR)
                             )
                             next_button.click()
                         except:
                             # 尝试JavaScript点击
-                            next_buttons = self.driver.find_elements(By.XPATH, "//div[@role='button']")
+                            next_buttons = driver.find_elements(*_ROLE_BUTTON_LOCATOR)
                             for button in next_buttons:
                                 if "next" in button.text.lower() or "下一步" in button.text:
-                                    self.driver.execute_script("arguments[0].click();", button)
+                                    driver.execute_script("arguments[0].click();", button)
                                     break
                     
                     logger.info("已点击用户名后的下一步按钮，等待密码输入框...")
-                    time.sleep(3)
+                    WebDriverWait(driver, 10).until(EC.staleness_of(username_input))
                 except:
                     logger.info("不需要额外输入用户名，继续...")
                 
                 # 输入密码
                 try:
                     logger.info("尝试查找密码输入框...")
-                    password_input = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.NAME, "password"))
+                    password_input = WebDriverWait(driver, 10).until(
+                        EC.presence_of_element_located(_PASSWORD_LOCATOR)
                     )
                     
                     logger.info("找到密码输入框，输入密码...")
                     password_input.clear()
-                    for char in password:
-                        password_input.send_keys(char)
-                        time.sleep(0.1)  # 模拟人工输入的时间间隔
-                    
-                    time.sleep(1)
+                    password_input.send_keys(password)
                     
                     # 点击登录按钮
                     try:
-                        login_button = WebDriverWait(self.driver, 10).until(
+                        login_button = WebDriverWait(driver, 10).until(
                             EC.element_to_be_clickable((By.XPATH, "//span[text()='Log in']"))
                         )
                         login_button.click()
                     except:
                         try:
-                            login_button = WebDriverWait(self.driver, 10).until(
+                            login_button = WebDriverWait(driver, 10).until(
                                 EC.element_to_be_clickable((By.CSS_SELECTOR, "div[data-testid='LoginForm_Login_Button']"))
                             )
                             login_button.click()
                         except:
                             # 尝试JavaScript点击
-                            login_buttons = self.driver.find_elements(By.XPATH, "//div[@role='button']")
+                            login_buttons = driver.find_elements(*_ROLE_BUTTON_LOCATOR)
                             for button in login_buttons:
                                 if "log in" in button.text.lower() or "登录" in button.text:
-                                    self.driver.execute_script("arguments[0].click();", button)
+                                    driver.execute_script("arguments[0].click();", button)
                                     break
                     
                     logger.info("已点击登录按钮，等待登录完成...")
-                    time.sleep(5)  # 等待登录完成
                     
                     # 检查是否登录成功
                     try:
                         # 检查是否有欢迎回来的消息或主页元素
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, "a[data-testid='AppTabBar_Home_Link']"))
+                        WebDriverWait(driver, 15).until(
+                            EC.presence_of_element_located(_HOME_LINK_LOCATOR)
                         )
                         logger.info("检测到主页元素，登录成功!")
                         return True
@@ -319,7 +705,7 @@ class SocialMediaAnalyzer:
                         
                         # 检查是否有验证码或安全挑战
                         try:
-                            if "verify" in self.driver.current_url or "challenge" in self.driver.current_url:
+                            if "verify" in driver.current_url or "challenge" in driver.current_url:
                                 logger.warning("检测到登录安全挑战，无法自动完成")
                                 return False
                         except:
@@ -328,7 +714,7 @@ class SocialMediaAnalyzer:
                         # 截图登录失败情况
                         try:
                             screenshot_path = "twitter_login_error.png"
-                            self.driver.save_screenshot(screenshot_path)
+                            driver.save_screenshot(screenshot_path)
                             logger.info(f"登录页面截图已保存到: {screenshot_path}")
                         except Exception as e:
                             logger.error(f"截图失败: {str(e)}")
@@ -358,10 +744,29 @@ class SocialMediaAnalyzer:
         Returns:
             list: 推文列表
         """
+        # 使用API时同步请求，不启动事件循环
+        if self.use_api:
+            with self._api_client() as client:
+                return self._fetch_tweets_api(client, account_name, count)
+        
         if not self.driver:
             logger.warning("Twitter未登录，无法获取推文")
             return []
-            
+        
+        with self._acquire_driver() as driver:
+            return self._fetch_tweets_with_driver(driver, account_name, count)
+    
+    @contextmanager
+    def _acquire_driver(self):
+        """从浏览器池中取出一个已登录的实例，池中暂无空闲实例时阻塞等待，用完后自动放回"""
+        driver = self._driver_pool.get()
+        try:
+            yield driver
+        finally:
+            self._driver_pool.put(driver)
+    
+    def _fetch_tweets_with_driver(self, driver, account_name, count):
+        """使用指定浏览器实例获取推文"""
         try:
             max_retries = 3
             retry_count = 0
@@ -370,108 +775,70 @@ class SocialMediaAnalyzer:
                 try:
                     # 访问用户主页
                     logger.info(f"正在访问{account_name}的Twitter主页...")
-                    self.driver.get(f"https://twitter.com/{account_name}")
+                    driver.get(f"https://twitter.com/{account_name}")
                     
                     # 等待页面加载
                     try:
-                        WebDriverWait(self.driver, 15).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, "article[data-testid='tweet']"))
+                        WebDriverWait(driver, 15).until(
+                            EC.presence_of_element_located(_TWEET_ARTICLE_LOCATOR)
                         )
                         logger.info(f"成功加载{account_name}的推文")
                     except:
                         logger.warning(f"等待推文加载超时，尝试继续处理...")
                     
-                    time.sleep(3)
-                    
-                    # 获取推文
+                    # 获取推文，滚动后页面上仍保留已解析的推文，按推文状态ID去重
                     tweets = []
-                    last_height = self.driver.execute_script("return document.body.scrollHeight")
+                    seen_ids = set()
+                    last_height = driver.execute_script("return document.body.scrollHeight")
                     scroll_attempts = 0
                     max_scroll_attempts = 5
                     
                     while len(tweets) < count and scroll_attempts < max_scroll_attempts:
-                        # 获取当前页面的推文
-                        tweet_elements = self.driver.find_elements(By.CSS_SELECTOR, "article[data-testid='tweet']")
+                        # 一次脚本调用提取当前页面所有推文的文本、时间和互动数据
+                        rows = driver.execute_script(_EXTRACT_TWEETS_JS)
                         
-                        if not tweet_elements:
+                        if not rows:
                             logger.warning(f"未找到{account_name}的推文元素，可能是页面结构变化或账户不存在")
                             # 截图记录错误
                             try:
                                 screenshot_path = f"twitter_{account_name}_error.png"
-                                self.driver.save_screenshot(screenshot_path)
+                                driver.save_screenshot(screenshot_path)
                                 logger.info(f"推文页面截图已保存到: {screenshot_path}")
                             except Exception as e:
                                 logger.error(f"截图失败: {str(e)}")
                             
                             scroll_attempts += 1
-                            time.sleep(2)
+                            try:
+                                WebDriverWait(driver, 2).until(
+                                    EC.presence_of_element_located(_TWEET_ARTICLE_LOCATOR)
+                                )
+                            except TimeoutException:
+                                pass
                             continue
                         
-                        logger.info(f"找到{len(tweet_elements)}条推文，正在解析...")
+                        logger.info(f"找到{len(rows)}条推文，正在解析...")
                         
-                        for tweet in tweet_elements:
-                            try:
-                                # 获取推文文本
-                                try:
-                                    text_element = tweet.find_element(By.CSS_SELECTOR, "div[data-testid='tweetText']")
-                                    text = text_element.text
-                                except:
-                                    # 尝试其他定位方式
-                                    try:
-                                        text_element = tweet.find_element(By.XPATH, ".//div[@lang]")
-                                        text = text_element.text
-                                    except:
-                                        text = "无法获取推文内容"
-                                
-                                # 获取时间
-                                try:
-                                    time_element = tweet.find_element(By.TAG_NAME, "time")
-                                    created_at = datetime.fromisoformat(time_element.get_attribute("datetime"))
-                                except:
-                                    # 如果无法获取时间，使用当前时间
-                                    created_at = datetime.now()
-                                
-                                # 获取互动数据
-                                try:
-                                    favorite_count = tweet.find_element(By.CSS_SELECTOR, "div[data-testid='like']").text
-                                    if not favorite_count:
-                                        favorite_count = "0"
-                                except:
-                                    favorite_count = "0"
-                                    
-                                try:
-                                    retweet_count = tweet.find_element(By.CSS_SELECTOR, "div[data-testid='retweet']").text
-                                    if not retweet_count:
-                                        retweet_count = "0"
-                                except:
-                                    retweet_count = "0"
-                                
-                                # 处理数字格式
-                                try:
-                                    fav_count = self._parse_count(favorite_count)
-                                    rt_count = self._parse_count(retweet_count)
-                                except:
-                                    fav_count = 0
-                                    rt_count = 0
-                                
-                                # 检查是否已经添加过相同ID的推文
+                        for text, created_at, favorite_count, retweet_count, status_id in rows:
+                            # 检查是否已经添加过相同ID的推文，取不到状态ID时按序号编号
+                            if status_id is not None:
+                                if status_id in seen_ids:
+                                    continue
+                                seen_ids.add(status_id)
+                                tweet_id = status_id
+                            else:
                                 tweet_id = f"{account_name}_{len(tweets) + 1}"
-                                if not any(t['id'] == tweet_id for t in tweets):
-                                    tweets.append({
-                                        'id': tweet_id,
-                                        'text': text,
-                                        'created_at': created_at,
-                                        'user': account_name,
-                                        'favorite_count': fav_count,
-                                        'retweet_count': rt_count
-                                    })
-                                    
-                                    if len(tweets) >= count:
-                                        break
-                                
-                            except Exception as e:
-                                logger.warning(f"解析推文失败: {str(e)}")
-                                continue
+                            
+                            tweets.append({
+                                'id': tweet_id,
+                                'text': text if text is not None else "无法获取推文内容",
+                                'created_at': created_at,
+                                'user': account_name,
+                                'favorite_count': self._parse_count(favorite_count),
+                                'retweet_count': self._parse_count(retweet_count)
+                            })
+                            
+                            if len(tweets) >= count:
+                                break
                         
                         # 如果已经获取足够的推文，跳出循环
                         if len(tweets) >= count:
@@ -479,19 +846,20 @@ class SocialMediaAnalyzer:
                         
                         # 滚动到页面底部加载更多推文
                         logger.info("滚动页面加载更多推文...")
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(3)
+                        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
                         
-                        new_height = self.driver.execute_script("return document.body.scrollHeight")
-                        if new_height == last_height:
-                            scroll_attempts += 1
-                        else:
-                            scroll_attempts = 0
+                        # 等待页面高度增加（新推文加载完成），超时说明没有更多内容
+                        try:
+                            WebDriverWait(driver, 5).until(
+                                lambda d: d.execute_script("return document.body.scrollHeight") > last_height
+                            )
+                        except TimeoutException:
+                            break
                         
-                        last_height = new_height
+                        last_height = driver.execute_script("return document.body.scrollHeight")
                     
                     logger.info(f"已获取{len(tweets)}条{account_name}的推文")
-                    return tweets
+                    return _localize_created_at(tweets)
                     
                 except Exception as e:
                     retry_count += 1
@@ -505,27 +873,270 @@ class SocialMediaAnalyzer:
             logger.error(f"获取{account_name}的推文失败: {str(e)}")
             return []
     
+    def _api_client(self) -> httpx.Client:
+        """创建已设置认证头的Twitter API同步客户端"""
+        return httpx.Client(headers={"Authorization": f"Bearer {self.bearer_token}"}, http2=_HTTP2,
+                            timeout=httpx.Timeout(15.0, connect=5.0))
+    
+    def _api_search_params(self, account_name: str, count: int, next_token: Optional[str] = None) -> Dict:
+        """
+        Twitter API最近推文搜索的请求参数
+        
+        接口单次最少返回10条、最多100条：count超过100时分页获取，不足10条时仍按10条请求，多出的推文一并返回，不浪费已消耗的配额。
+        """
+        params = {
+            "query": f"from:{account_name} -is:retweet",
+            "max_results": min(max(count, _API_MIN_RESULTS), _API_MAX_RESULTS),
+            "tweet.fields": "created_at,public_metrics"
+        }
+        if next_token:
+            params["next_token"] = next_token
+        return params
+    
+    def _rate_limit_remaining(self) -> float:
+        """距离限流解除的秒数，未限流时不大于0"""
+        with self._rate_limit_lock:
+            return self._rate_limited_until - time.time()
+    
+    def _record_rate_limit(self, response: httpx.Response) -> None:
+        """记录限流解除时间，多个请求同时被限流时只会延长不会缩短"""
+        reset = response.headers.get("x-rate-limit-reset", "")
+        until = float(reset) if reset.isdigit() else time.time() + _RATE_LIMIT_DEFAULT_WAIT
+        with self._rate_limit_lock:
+            self._rate_limited_until = max(self._rate_limited_until, until)
+        logger.warning(f"Twitter API触发限流，{int(until - time.time())}秒内暂停请求")
+    
+    def _api_tweets(self, data: List[Dict], account_name: str) -> List[Dict]:
+        """将API返回的推文转换为与fetch_tweets一致的格式"""
+        tweets = []
+        for item in data:
+            metrics = item.get("public_metrics", {})
+            tweets.append({
+                'id': item.get("id", f"{account_name}_{len(tweets) + 1}"),
+                'text': item.get("text", ""),
+                'created_at': item.get("created_at"),
+                'user': account_name,
+                'favorite_count': metrics.get("like_count", 0),
+                'retweet_count': metrics.get("retweet_count", 0)
+            })
+        
+        logger.info(f"已获取{len(tweets)}条{account_name}的推文")
+        return _localize_created_at(tweets)
+    
+    def _fetch_tweets_api(self, client: httpx.Client, account_name: str, count: int = 100) -> List[Dict]:
+        """
+        通过Twitter API同步获取指定账户的最新推文
+        
+        Args:
+            client: 已设置认证头的HTTP客户端
+            account_name: Twitter账户名称
+            count: 获取的推文数量
+            
+        Returns:
+            list: 推文列表，格式与fetch_tweets一致
+        """
+        data, next_token = [], None
+        while True:
+            page = self._get_api_page(client, account_name, self._api_search_params(account_name, count - len(data), next_token))
+            if page is None:
+                break
+            data.extend(page.get("data", []))
+            next_token = page.get("meta", {}).get("next_token")
+            if len(data) >= count or not next_token:
+                break
+        
+        return self._api_tweets(data, account_name)
+    
+    def _get_api_page(self, client: httpx.Client, account_name: str, params: Dict) -> Optional[Dict]:
+        """请求一页搜索结果，网络错误和5xx错误按指数退避重试，失败或限流时返回None"""
+        for attempt in range(_API_MAX_RETRIES + 1):
+            # 已触发限流时在重置时间之前直接返回，不再发出注定失败的请求
+            if self._rate_limit_remaining() > 0:
+                logger.warning(f"Twitter API限流中，跳过获取{account_name}的推文")
+                return None
+            
+            try:
+                response = client.get(_TWITTER_SEARCH_URL, params=params)
+                if response.status_code == 429:
+                    self._record_rate_limit(response)
+                    return None
+                
+                response.raise_for_status()
+                return response.json()
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                # 只有网络错误和服务端错误值得重试，其余错误直接放弃
+                retryable = isinstance(e, httpx.TransportError) or e.response.status_code >= 500
+                if not retryable or attempt == _API_MAX_RETRIES:
+                    logger.error(f"获取{account_name}的推文失败: {str(e)}")
+                    return None
+                
+                delay = _API_RETRY_DELAY * 2 ** attempt
+                logger.warning(f"获取{account_name}的推文失败 (尝试 {attempt + 1}/{_API_MAX_RETRIES + 1}): {str(e)}，{delay}秒后重试")
+                time.sleep(delay)
+            except Exception as e:
+                logger.error(f"获取{account_name}的推文失败: {str(e)}")
+                return None
+    
+    async def fetch_tweets_async(self, client: httpx.AsyncClient, account_name: str, count: int = 100) -> List[Dict]:
+        """
+        通过Twitter API获取指定账户的最新推文
+        
+        Args:
+            client: 已设置认证头的HTTP客户端
+            account_name: Twitter账户名称
+            count: 获取的推文数量
+            
+        Returns:
+            list: 推文列表，格式与fetch_tweets一致
+        """
+        data, next_token = [], None
+        while True:
+            page = await self._get_api_page_async(client, account_name, self._api_search_params(account_name, count - len(data), next_token))
+            if page is None:
+                break
+            data.extend(page.get("data", []))
+            next_token = page.get("meta", {}).get("next_token")
+            if len(data) >= count or not next_token:
+                break
+        
+        return self._api_tweets(data, account_name)
+    
+    async def _get_api_page_async(self, client: httpx.AsyncClient, account_name: str, params: Dict) -> Optional[Dict]:
+        """异步请求一页搜索结果，重试和限流处理与_get_api_page一致"""
+        for attempt in range(_API_MAX_RETRIES + 1):
+            # 已触发限流时在重置时间之前直接返回，不再发出注定失败的请求
+            if self._rate_limit_remaining() > 0:
+                logger.warning(f"Twitter API限流中，跳过获取{account_name}的推文")
+                return None
+            
+            try:
+                response = await client.get(_TWITTER_SEARCH_URL, params=params)
+                if response.status_code == 429:
+                    self._record_rate_limit(response)
+                    return None
+                
+                response.raise_for_status()
+                return response.json()
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                # 只有网络错误和服务端错误值得重试，其余错误直接放弃
+                retryable = isinstance(e, httpx.TransportError) or e.response.status_code >= 500
+                if not retryable or attempt == _API_MAX_RETRIES:
+                    logger.error(f"获取{account_name}的推文失败: {str(e)}")
+                    return None
+                
+                delay = _API_RETRY_DELAY * 2 ** attempt
+                logger.warning(f"获取{account_name}的推文失败 (尝试 {attempt + 1}/{_API_MAX_RETRIES + 1}): {str(e)}，{delay}秒后重试")
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error(f"获取{account_name}的推文失败: {str(e)}")
+                return None
+    
+    async def fetch_all(self, accounts: List[str], count: int = 100) -> Dict[str, List[Dict]]:
+        """
+        并发获取多个账户的最新推文，单个账户失败不影响其他账户
+        
+        Args:
+            accounts: Twitter账户名称列表
+            count: 每个账户获取的推文数量
+            
+        Returns:
+            Dict: 账户名称到推文列表的映射
+        """
+        accounts = list(dict.fromkeys(accounts))
+        
+        if self.use_api:
+            semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            headers = {"Authorization": f"Bearer {self.bearer_token}"}
+            async with httpx.AsyncClient(headers=headers, http2=_HTTP2, timeout=httpx.Timeout(15.0, connect=5.0)) as client:
+                async def fetch(account):
+                    async with semaphore:
+                        return await self.fetch_tweets_async(client, account, count)
+                
+                results = await asyncio.gather(*(fetch(account) for account in accounts), return_exceptions=True)
+        else:
+            # 使用浏览器池时在线程中获取，并发数不超过浏览器数量
+            semaphore = asyncio.Semaphore(max(len(self._drivers), 1))
+            
+            async def fetch(account):
+                async with semaphore:
+                    return await asyncio.to_thread(self.fetch_tweets, account, count)
+            
+            results = await asyncio.gather(*(fetch(account) for account in accounts), return_exceptions=True)
+        
+        return self._merge_fetch_results(accounts, results)
+    
+    def fetch_many(self, accounts: List[str], count: int = 100) -> Dict[str, List[Dict]]:
+        """
+        获取多个账户的最新推文（同步版本），在线程池中并发请求，单个账户失败不影响其他账户
+        
+        Args:
+            accounts: Twitter账户名称列表
+            count: 每个账户获取的推文数量
+            
+        Returns:
+            Dict: 账户名称到推文列表的映射
+        """
+        accounts = list(dict.fromkeys(accounts))
+        if not accounts:
+            return {}
+        
+        def collect(futures):
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+            return results
+        
+        if self.use_api:
+            # 所有请求共用一个客户端（线程安全），复用连接
+            with self._api_client() as client, \
+                    ThreadPoolExecutor(max_workers=min(self.max_concurrent_requests, len(accounts))) as executor:
+                results = collect([executor.submit(self._fetch_tweets_api, client, account, count) for account in accounts])
+        else:
+            # 使用浏览器池时并发数不超过浏览器数量
+            with ThreadPoolExecutor(max_workers=min(max(len(self._drivers), 1), len(accounts))) as executor:
+                results = collect([executor.submit(self.fetch_tweets, account, count) for account in accounts])
+        
+        return self._merge_fetch_results(accounts, results)
+    
+    def _merge_fetch_results(self, accounts: List[str], results: List) -> Dict[str, List[Dict]]:
+        """整理各账户的获取结果，失败的账户记录错误并返回空列表"""
+        tweets_by_account = {}
+        for account, result in zip(accounts, results):
+            if isinstance(result, Exception):
+                logger.error(f"获取{account}的推文失败: {str(result)}")
+                result = []
+            tweets_by_account[account] = result
+        
+        return tweets_by_account
+    
+    def _can_fetch_tweets(self) -> bool:
+        """是否可以获取真实推文（非模拟模式，且配置了API令牌或浏览器已登录）"""
+        return not self.simulation_mode and (self.use_api or self.driver is not None)
+    
     def _parse_count(self, count_str):
         """解析推文互动数量字符串"""
-        try:
-            if not count_str or count_str == "":
-                return 0
-            
-            # 处理 K, M 等单位
-            if 'K' in count_str or 'k' in count_str:
-                return int(float(count_str.replace('K', '').replace('k', '')) * 1000)
-            elif 'M' in count_str or 'm' in count_str:
-                return int(float(count_str.replace('M', '').replace('m', '')) * 1000000)
-            else:
-                # 移除可能的逗号
-                return int(count_str.replace(',', ''))
-        except:
+        # 最常见的是不带单位和千分位的纯数字，直接转换
+        if count_str and count_str.isdecimal():
+            return int(count_str)
+        
+        # 提取数字部分（可含千分位逗号和小数）及K/M/B单位，如"1,234"、"1.2K"、"3M"
+        match = _COUNT_RE.search(count_str or "")
+        if not match:
             return 0
+        
+        number, unit = match.groups()
+        return int(float(number.replace(',', '')) * _COUNT_UNITS[unit.upper()])
     
     def __del__(self):
         """清理资源"""
-        if self.driver:
-            self.driver.quit()
+        for driver in getattr(self, '_drivers', []):
+            try:
+                driver.quit()
+            except Exception:
+                pass
     
     def analyze_tweet_sentiment(self, tweet_text):
         """
@@ -538,19 +1149,32 @@ class SocialMediaAnalyzer:
             float: 情感分数，范围[-1, 1]，正数表示积极，负数表示消极
         """
         try:
-            # 清理文本
-            cleaned_text = self._clean_text(tweet_text)
-            
-            # 使用TextBlob进行情感分析
-            blob = TextBlob(cleaned_text)
-            sentiment_score = blob.sentiment.polarity
+            # 相同文本直接返回缓存结果
+            if self.sentiment_engine == "vader":
+                return _vader_compound(tweet_text)
             
-            return sentiment_score
+            # 清理文本后使用TextBlob进行情感分析
+            return _sentiment_polarity(tweet_text)
             
         except Exception as e:
             logger.error(f"分析推文情感失败: {str(e)}")
             return 0.0
     
+    def _score_tweets(self, tweets) -> np.ndarray:
+        """
+        批量计算推文情感分数
+        
+        Args:
+            tweets: 推文列表
+            
+        Returns:
+            np.ndarray: 与tweets一一对应的情感分数数组
+        """
+        return np.fromiter(
+            (self.analyze_tweet_sentiment(tweet['text']) for tweet in tweets),
+            dtype=np.float64, count=len(tweets)
+        )
+    
     def _clean_text(self, text):
         """
         清理文本，去除URL、@提及、特殊字符等
@@ -561,20 +1185,58 @@ class SocialMediaAnalyzer:
         Returns:
             str: 清理后的文本
         """
-        # 去除URL
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+        # 一次扫描去除URL、@提及、特殊字符和数字，再转换为小写
+        return _clean_text_cached(text)
+    
+    def get_cache_stats(self) -> Dict:
+        """
+        获取文本处理缓存的命中统计，用于排查缓存是否生效
         
-        # 去除@提及
-        text = re.sub(r'@\w+', '', text)
+        Returns:
+            Dict: 缓存名称到命中次数、未命中次数、容量和当前大小的映射
+        """
+        caches = {
+            "clean_text": _clean_text_cached,
+            "textblob_sentiment": _sentiment_polarity,
+            "vader_sentiment": _vader_compound,
+            "topic_tokens": _topic_tokens_cached,
+            "summary_tokens": _summary_tokens_cached
+        }
+        return {name: func.cache_info()._asdict() for name, func in caches.items()}
+    
+    def _build_keyword_automaton(self):
+        """
+        构建关键词Aho-Corasick自动机，一次扫描即可匹配所有关键词
         
-        # 去除特殊字符和数字
-        text = re.sub(r'[^\w\s]', '', text)
-        text = re.sub(r'\d+', '', text)
+        Returns:
+            ahocorasick.Automaton: 关键词自动机，未安装pyahocorasick或没有关键词时返回None
+        """
+        if ahocorasick is None:
+            return None
         
-        # 转换为小写
-        text = text.lower()
+        words = {lower for _, lower in self._keywords_lower if lower}
+        if not words:
+            return None
         
-        return text
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return automaton
+    
+    def _build_keyword_regex(self):
+        """
+        构建关键词正则交替式，未安装pyahocorasick时用于预筛选
+        
+        Returns:
+            re.Pattern: 匹配任一关键词的正则，没有关键词时返回None
+        """
+        words = {lower for _, lower in self._keywords_lower if lower}
+        if not words:
+            return None
+        
+        # 长词在前，避免交替式被短前缀提前截断
+        return re.compile("|".join(re.escape(word) for word in sorted(words, key=len, reverse=True)))
     
     def detect_important_keywords(self, text):
         """
@@ -586,17 +1248,24 @@ class SocialMediaAnalyzer:
         Returns:
             list: 检测到的关键词列表
         """
+        # 未配置关键词时无需处理文本
+        if not self._keywords_lower:
+            return []
+        
         try:
             # 转换为小写
             text = text.lower()
             
-            # 检测重要关键词
-            found_keywords = []
-            for keyword in self.important_keywords:
-                if keyword.lower() in text:
-                    found_keywords.append(keyword)
+            # 使用自动机一次扫描匹配所有关键词，结果按配置顺序返回
+            if self._keyword_automaton is not None:
+                found = {word for _, word in self._keyword_automaton.iter(text)}
+                return [keyword for keyword, lower in self._keywords_lower if not lower or lower in found]
+            
+            # 大多数推文不含任何关键词，先用一次正则扫描排除，命中后再逐个确认（关键词可能互相重叠）
+            if self._keyword_regex is None or not self._keyword_regex.search(text):
+                return [keyword for keyword, lower in self._keywords_lower if not lower]
             
-            return found_keywords
+            return [keyword for keyword, lower in self._keywords_lower if lower in text]
             
         except Exception as e:
             logger.error(f"检测关键词失败: {str(e)}")
@@ -614,22 +1283,9 @@ class SocialMediaAnalyzer:
             list: 常见话题列表
         """
         try:
-            # 合并所有推文文本
-            all_text = " ".join([tweet['text'] for tweet in tweets])
-            
-            # 清理文本
-            cleaned_text = self._clean_text(all_text)
-            
-            # 分词
-            tokens = word_tokenize(cleaned_text)
-            
-            # 过滤停用词
-            stop_words = ['the', 'a', 'an', 'and', 'or', 'but', 'is', 'are', 'was', 
-                         'were', 'to', 'of', 'in', 'for', 'with', 'by', 'at', 'on']
-            filtered_tokens = [word for word in tokens if word.lower() not in stop_words and len(word) > 2]
-            
-            # 统计词频
-            word_counts = Counter(filtered_tokens)
+            # 逐条清理、分词并过滤停用词（只保留长度大于2的词），重复推文使用缓存
+            # 各条推文的词串联后一次计入词频，不生成汇总的词列表
+            word_counts = Counter(chain.from_iterable(_topic_tokens_cached(tweet['text']) for tweet in tweets))
             
             # 返回最常见的词
             return word_counts.most_common(top_n)
@@ -640,132 +1296,149 @@ class SocialMediaAnalyzer:
     
     def analyze_binance_tweets(self):
         """
-        分析币安相关账户的推文
+        分析币安相关账户的推文（同步获取，不启动事件循环，可在已有事件循环的线程中调用）
         
         Returns:
             dict: 分析结果
         """
-        if not self.driver:
+        if not self._can_fetch_tweets():
             logger.warning("Twitter未登录或初始化失败，将使用模拟数据")
-            return self._generate_mock_analysis()
+            return self._generate_mock_binance_analysis()
         
         # 尝试获取推文，如果失败则使用模拟数据
         try:
-            all_tweets = []
-            
-            # 获取所有配置的Twitter账户的推文
-            for account in self.twitter_accounts:
-                try:
-                    account_tweets = self.fetch_tweets(account, count=20)
-                    all_tweets.extend(account_tweets)
-                except Exception as e:
-                    logger.error(f"获取{account}的推文失败: {str(e)}")
+            # 获取所有配置的Twitter账户的推文，只保留最近24小时的推文
+            now, recent_tweets = self._recent_tweets(self.fetch_many(self.twitter_accounts, count=20))
             
             # 如果无法获取真实推文，使用模拟数据
-            if not all_tweets:
+            if recent_tweets is None:
                 logger.warning("无法获取真实推文，使用模拟数据")
-                return self._generate_mock_analysis()
+                return self._generate_mock_binance_analysis()
             
-            # 按时间排序
-            all_tweets.sort(key=lambda x: x['created_at'], reverse=True)
+            return self._build_binance_analysis(now, recent_tweets, self._score_tweets(recent_tweets))
+        
+        except Exception as e:
+            logger.error(f"分析币安推文过程出错: {str(e)}")
+            return self._generate_mock_binance_analysis()
+    
+    async def analyze_binance_tweets_async(self):
+        """
+        分析币安相关账户的推文（异步版本，可在已有事件循环中调用）
+        
+        Returns:
+            dict: 分析结果
+        """
+        if not self._can_fetch_tweets():
+            logger.warning("Twitter未登录或初始化失败，将使用模拟数据")
+            return self._generate_mock_binance_analysis()
+        
+        # 尝试获取推文，如果失败则使用模拟数据
+        try:
+            # 获取所有配置的Twitter账户的推文，只保留最近24小时的推文
+            now, recent_tweets = self._recent_tweets(await self.fetch_all(self.twitter_accounts, count=20))
             
-            # 只保留最近24小时的推文
-            recent_time = datetime.now() - timedelta(hours=24)
-            recent_tweets = [tweet for tweet in all_tweets if tweet['created_at'] > recent_time]
+            # 如果无法获取真实推文，使用模拟数据
+            if recent_tweets is None:
+                logger.warning("无法获取真实推文，使用模拟数据")
+                return self._generate_mock_binance_analysis()
             
-            # 分析每条推文的情感和关键词
-            for tweet in recent_tweets:
-                tweet['sentiment_score'] = self.analyze_tweet_sentiment(tweet['text'])
-                tweet['important_keywords'] = self.detect_important_keywords(tweet['text'])
-                
-                # 根据情感分数确定情感类别
-                if tweet['sentiment_score'] >= self.sentiment_threshold['positive']:
-                    tweet['sentiment'] = 'positive'
-                elif tweet['sentiment_score'] <= self.sentiment_threshold['negative']:
-                    tweet['sentiment'] = 'negative'
-                else:
-                    tweet['sentiment'] = 'neutral'
+            # 在线程中计算每条推文的情感分数，避免纯Python的情感分析阻塞事件循环
+            scores = await asyncio.to_thread(self._score_tweets, recent_tweets)
+            return self._build_binance_analysis(now, recent_tweets, scores)
+        
+        except Exception as e:
+            logger.error(f"分析币安推文过程出错: {str(e)}")
+            return self._generate_mock_binance_analysis()
+    
+    def _recent_tweets(self, tweets_by_account: Dict[str, List[Dict]]) -> Tuple[datetime, Optional[List[Dict]]]:
+        """
+        取出最近24小时的推文（无需整体排序）
+        
+        Args:
+            tweets_by_account: 账户名称到推文列表的映射
             
-            # 计算总体情感分数
-            if recent_tweets:
-                overall_sentiment = sum(tweet['sentiment_score'] for tweet in recent_tweets) / len(recent_tweets)
-            else:
-                overall_sentiment = 0
-                
-            # 提取常见话题
-            common_topics = self.extract_common_topics(recent_tweets)
-            
-            # 找出重要公告
-            important_announcements = [
-                tweet for tweet in recent_tweets 
-                if tweet['important_keywords'] and 
-                (tweet['retweet_count'] > 50 or tweet['favorite_count'] > 100)
-            ]
+        Returns:
+            Tuple: (本轮分析的参考时间, 最近的推文列表)，没有获取到任何推文时推文列表为None
+        """
+        # 取一次当前本地时间作为本轮分析的参考时间
+        now = datetime.now()
+        all_tweets = [tweet for tweets in tweets_by_account.values() for tweet in tweets]
+        if not all_tweets:
+            return now, None
+        
+        times = np.array([tweet['created_at'] for tweet in all_tweets], dtype='datetime64[s]')
+        recent_idx = np.flatnonzero(times > np.datetime64(now, 's') - np.timedelta64(24, 'h'))
+        return now, [all_tweets[i] for i in recent_idx.tolist()]
+    
+    def _build_binance_analysis(self, now: datetime, recent_tweets: List[Dict], scores: np.ndarray) -> Dict:
+        """
+        由最近的推文及其情感分数生成分析结果
+        
+        Args:
+            now: 本轮分析的参考时间
+            recent_tweets: 最近24小时的推文
+            scores: 各推文的情感分数
             
-            # 整合分析结果
-            analysis_result = {
-                'timestamp': datetime.now(),
-                'total_tweets_analyzed': len(recent_tweets),
-                'overall_sentiment': overall_sentiment,
-                'sentiment_category': self._get_sentiment_category(overall_sentiment),
-                'common_topics': common_topics,
-                'important_announcements': important_announcements[:5],  # 只返回最重要的5条
-                'market_insights': self._generate_market_insights(recent_tweets, overall_sentiment),
-                'recent_tweets': recent_tweets[:10]  # 只返回最新的10条推文
-            }
+        Returns:
+            dict: 分析结果
+        """
+        # 一次向量化比较确定情感类别并统计积极、消极数量
+        codes, positive_count, negative_count = _classify_sentiment(
+            scores, float(self.sentiment_threshold['positive']), float(self.sentiment_threshold['negative'])
+        )
+        
+        # 一次遍历写回情感和关键词，同时用定长堆保留最新的10条推文和5条重要公告
+        # 堆元素为(时间, -序号, 推文)，时间相同时先获取的推文优先，与稳定排序一致
+        latest, announcements = [], []
+        for i, (tweet, score, code) in enumerate(zip(recent_tweets, scores.tolist(), codes.tolist())):
+            tweet['sentiment_score'] = score
+            tweet['sentiment'] = _SENTIMENT_LABELS[code]
+            tweet['important_keywords'] = self.detect_important_keywords(tweet['text'])
             
-            return analysis_result
+            entry = (tweet['created_at'], -i, tweet)
+            _push_top(latest, 10, entry)
+            if tweet['important_keywords'] and (tweet['retweet_count'] > 50 or tweet['favorite_count'] > 100):
+                _push_top(announcements, 5, entry)
         
-        except Exception as e:
-            logger.error(f"分析币安推文过程出错: {str(e)}")
-            return self._generate_mock_analysis()
+        # 计算总体情感分数
+        overall_sentiment = float(scores.mean()) if recent_tweets else 0
+            
+        # 提取常见话题
+        common_topics = self.extract_common_topics(recent_tweets)
+        
+        # 按时间倒序取出最新的重要公告
+        important_announcements = [entry[2] for entry in sorted(announcements, reverse=True)]
+        
+        # 整合分析结果
+        return {
+            'timestamp': now,
+            'total_tweets_analyzed': len(recent_tweets),
+            'overall_sentiment': overall_sentiment,
+            'sentiment_category': self._get_sentiment_category(overall_sentiment),
+            'common_topics': common_topics,
+            'important_announcements': important_announcements,
+            'market_insights': self._generate_market_insights(
+                recent_tweets, overall_sentiment, (positive_count, negative_count)
+            ),
+            'recent_tweets': [entry[2] for entry in sorted(latest, reverse=True)]  # 只返回最新的10条推文
+        }
     
-    def _generate_mock_analysis(self):
+    def _generate_mock_binance_analysis(self):
         """
         生成模拟的社交媒体分析数据
         
         Returns:
             dict: 模拟的分析结果
         """
-        # 当无法访问真实API时使用的模拟数据
+        # 当无法访问真实API时使用的模拟数据，发布时间相对当前时间计算，每次返回新的推文字典
+        now = datetime.now()
         mock_tweets = [
-            {
-                'id': '1',
-                'text': 'We are excited to announce a new listing on Binance: XYZ Token (XYZ)!',
-                'created_at': datetime.now() - timedelta(hours=2),
-                'user': 'binance',
-                'favorite_count': 530,
-                'retweet_count': 210,
-                'sentiment_score': 0.75,
-                'sentiment': 'positive',
-                'important_keywords': ['listing', 'announcement']
-            },
-            {
-                'id': '2',
-                'text': 'Market update: Bitcoin has shown strong resilience in the past 24 hours.',
-                'created_at': datetime.now() - timedelta(hours=5),
-                'user': 'BinanceResearch',
-                'favorite_count': 320,
-                'retweet_count': 95,
-                'sentiment_score': 0.45,
-                'sentiment': 'neutral',
-                'important_keywords': ['update']
-            },
-            {
-                'id': '3',
-                'text': 'Warning: Beware of phishing attempts. Always verify you are on the official Binance website.',
-                'created_at': datetime.now() - timedelta(hours=10),
-                'user': 'cz_binance',
-                'favorite_count': 850,
-                'retweet_count': 420,
-                'sentiment_score': -0.2,
-                'sentiment': 'neutral',
-                'important_keywords': []
-            }
+            dict(tweet, created_at=now - timedelta(hours=hours_ago), important_keywords=list(tweet['important_keywords']))
+            for hours_ago, tweet in _MOCK_BINANCE_TWEETS
         ]
         
         return {
-            'timestamp': datetime.now(),
+            'timestamp': now,
             'total_tweets_analyzed': len(mock_tweets),
             'overall_sentiment': 0.33,
             'sentiment_category': 'neutral',
@@ -793,64 +1466,59 @@ class SocialMediaAnalyzer:
         else:
             return 'neutral'
     
-    def _generate_market_insights(self, tweets, overall_sentiment):
+    def _generate_market_insights(self, tweets, overall_sentiment, sentiment_counts=None):
         """
         根据推文和情感分析生成市场洞察
         
         Args:
             tweets: 推文列表
             overall_sentiment: 总体情感分数
+            sentiment_counts: 已统计好的(积极数量, 消极数量)（可选），提供时不再逐条统计情感类别
             
         Returns:
             str: 市场洞察
         """
-        # 计算带有重要关键词的推文比例
-        important_tweets_count = sum(1 for tweet in tweets if tweet['important_keywords'])
-        important_tweet_ratio = important_tweets_count / len(tweets) if tweets else 0
-        
-        # 计算积极和消极推文的比例
-        positive_tweets = [tweet for tweet in tweets if tweet.get('sentiment') == 'positive']
-        negative_tweets = [tweet for tweet in tweets if tweet.get('sentiment') == 'negative']
-        
-        positive_ratio = len(positive_tweets) / len(tweets) if tweets else 0
-        negative_ratio = len(negative_tweets) / len(tweets) if tweets else 0
-        
-        # 生成市场洞察
-        insights = "社交媒体分析："
-        
-        # 情感洞察
-        if overall_sentiment >= 0.5:
-            insights += "整体情绪十分积极，市场可能处于乐观状态。"
-        elif overall_sentiment >= 0.2:
-            insights += "整体情绪偏积极，市场情绪良好。"
-        elif overall_sentiment >= -0.2:
-            insights += "整体情绪中性，市场情绪稳定。"
-        elif overall_sentiment >= -0.5:
-            insights += "整体情绪偏消极，市场可能存在担忧。"
+        if sentiment_counts is not None:
+            # 情感类别已批量统计，只需统计带有重要关键词的推文数量
+            important_count = sum(1 for tweet in tweets if tweet['important_keywords'])
+            positive_count, negative_count = sentiment_counts
         else:
-            insights += "整体情绪十分消极，市场可能处于悲观状态。"
+            # 一次遍历统计带有重要关键词、积极和消极的推文数量
+            important_count = positive_count = negative_count = 0
+            for tweet in tweets:
+                if tweet['important_keywords']:
+                    important_count += 1
+                sentiment = tweet.get('sentiment')
+                if sentiment == 'positive':
+                    positive_count += 1
+                elif sentiment == 'negative':
+                    negative_count += 1
         
-        # 重要消息洞察
-        if important_tweet_ratio >= 0.3:
-            insights += "有大量重要消息发布，需密切关注市场反应。"
-        elif important_tweet_ratio >= 0.1:
-            insights += "有少量重要消息发布，可能会影响部分币种表现。"
-        else:
-            insights += "未发现重要消息，市场可能维持目前趋势。"
+        # 计算各类推文的比例
+        total = len(tweets) or 1
+        important_tweet_ratio = important_count / total
+        positive_ratio = positive_count / total
+        negative_ratio = negative_count / total
+        
+        # 情感洞察与重要消息洞察：按阈值区间查表
+        parts = [
+            _SENTIMENT_INSIGHTS[bisect_right(_SENTIMENT_INSIGHT_BOUNDS, overall_sentiment)],
+            _IMPORTANT_INSIGHTS[bisect_right(_IMPORTANT_INSIGHT_BOUNDS, important_tweet_ratio)]
+        ]
         
         # 积极/消极比例洞察
         if positive_ratio > negative_ratio * 3:
-            insights += "正面消息远多于负面消息，可能利好市场。"
+            parts.append("正面消息远多于负面消息，可能利好市场。")
         elif positive_ratio > negative_ratio * 1.5:
-            insights += "正面消息多于负面消息，市场整体偏乐观。"
+            parts.append("正面消息多于负面消息，市场整体偏乐观。")
         elif negative_ratio > positive_ratio * 3:
-            insights += "负面消息远多于正面消息，可能利空市场。"
+            parts.append("负面消息远多于正面消息，可能利空市场。")
         elif negative_ratio > positive_ratio * 1.5:
-            insights += "负面消息多于正面消息，市场整体偏谨慎。"
+            parts.append("负面消息多于正面消息，市场整体偏谨慎。")
         else:
-            insights += "正面消息与负面消息基本平衡，市场情绪中立。"
+            parts.append("正面消息与负面消息基本平衡，市场情绪中立。")
         
-        return insights
+        return "社交媒体分析：" + "".join(parts)
 
     def get_social_summary(self) -> Dict:
         """
@@ -865,60 +1533,56 @@ class SocialMediaAnalyzer:
         }
         
         # 如果使用模拟模式或没有初始化Twitter客户端，返回模拟数据
-        if self.simulation_mode or not self.driver:
+        if not self._can_fetch_tweets():
             logger.info("使用模拟数据生成社交媒体分析")
             
             for symbol in self.config.get("symbols", ["BTC/USDT"]):
-                summary["symbols"][symbol] = self._generate_mock_analysis(symbol)
+                summary["symbols"][symbol] = self._generate_mock_symbol_analysis(symbol)
                 
             return summary
         
         # 获取Twitter数据并分析
         try:
+            symbol_accounts = {}
             for symbol in self.config.get("symbols", ["BTC/USDT"]):
                 # 提取货币名称
-                currency = symbol.split("/")[0]
+                currency = symbol.split("/")[0].lower()
                 
-                # 获取相关账号的推文
-                accounts = [account for account in self.twitter_accounts if currency.lower() in account.lower()]
+                # 确定相关账号，限制只查询前两个账号，找到两个后即停止扫描
+                accounts = list(islice((account for account, lower in self._accounts_lower if currency in lower), 2))
                 if not accounts:
                     accounts = self.twitter_accounts[:2]  # 取前两个账号
-                
-                all_tweets = []
-                for account in accounts[:2]:  # 限制只查询前两个账号
-                    tweets = self.fetch_tweets(account, count=10)
-                    all_tweets.extend(tweets)
+                symbol_accounts[symbol] = accounts
+            
+            # 所有交易对的相关账号一次性获取，相同账号只请求一次（同步获取，不启动事件循环）
+            tweets_by_account = self.fetch_many(
+                [account for accounts in symbol_accounts.values() for account in accounts], count=10
+            )
+            
+            for symbol, accounts in symbol_accounts.items():
+                all_tweets = [tweet for account in accounts for tweet in tweets_by_account.get(account, [])]
                 
                 # 如果无法获取推文，使用模拟数据
                 if not all_tweets:
                     logger.warning(f"无法获取{symbol}的推文，使用模拟数据")
-                    summary["symbols"][symbol] = self._generate_mock_analysis(symbol)
+                    summary["symbols"][symbol] = self._generate_mock_symbol_analysis(symbol)
                     continue
                 
-                # 分析推文情感
-                sentiment_scores = []
-                important_news = []
-                hot_topics = []
+                # 只分析前20条推文，情感分数一次收集为数组后求均值
+                analyzed_tweets = all_tweets[:20]
+                scores = self._score_tweets(analyzed_tweets)
                 
-                for tweet in all_tweets[:20]:  # 只分析前20条推文
-                    # 情感分析
-                    sentiment_score = self.analyze_tweet_sentiment(tweet['text'])
-                    sentiment_scores.append(sentiment_score)
-                    
-                    # 检测重要关键词
-                    keywords = self.detect_important_keywords(tweet['text'])
-                    if keywords:
-                        important_news.append(tweet['text'][:100] + "...")
-                    
-                    # 提取关键词
-                    words = self._clean_text(tweet['text']).split()
-                    hot_topics.extend([w for w in words if len(w) > 3])
+                # 检测重要关键词，最多只需要3条重要新闻，凑齐后不再检测
+                important_news = [
+                    tweet['text'][:100] + "..."
+                    for tweet in islice((t for t in analyzed_tweets if self.detect_important_keywords(t['text'])), 3)
+                ]
+                
+                # 提取关键词，各条推文的词串联后一次计入词频
+                topic_counter = Counter(chain.from_iterable(_summary_tokens_cached(tweet['text']) for tweet in analyzed_tweets))
                 
                 # 汇总数据
-                if sentiment_scores:
-                    avg_sentiment = sum(sentiment_scores) / len(sentiment_scores)
-                else:
-                    avg_sentiment = 0
+                avg_sentiment = float(scores.mean())
                 
                 market_sentiment = "中性"
                 if avg_sentiment > 0.2:
@@ -927,14 +1591,12 @@ class SocialMediaAnalyzer:
                     market_sentiment = "消极"
                 
                 # 获取热门话题（频率最高的5个）
-                from collections import Counter
-                topic_counter = Counter(hot_topics)
                 popular_topics = [topic for topic, _ in topic_counter.most_common(5)]
                 
                 summary["symbols"][symbol] = {
                     "sentiment_score": round(avg_sentiment, 2),
                     "market_sentiment": market_sentiment,
-                    "important_news": important_news[:3],  # 最多3条重要新闻
+                    "important_news": important_news,  # 最多3条重要新闻
                     "hot_topics": popular_topics,
                     "timestamp": datetime.now().isoformat(),
                     "is_real_data": True
@@ -946,30 +1608,24 @@ class SocialMediaAnalyzer:
             logger.error(f"获取社交媒体摘要失败: {str(e)}")
             # 返回模拟数据
             for symbol in self.config.get("symbols", ["BTC/USDT"]):
-                summary["symbols"][symbol] = self._generate_mock_analysis(symbol)
+                summary["symbols"][symbol] = self._generate_mock_symbol_analysis(symbol)
             return summary
 
-    def _generate_mock_analysis(self, symbol: str) -> Dict:
-        """生成模拟分析结果"""
-        # 随机模拟分析结果
-        import random
+    def _generate_mock_symbol_analysis(self, symbol: str) -> Dict:
+        """生成单个交易对的模拟分析结果，同一交易对在缓存时间内返回相同结果"""
+        now = time.monotonic()
+        cached = self._mock_symbol_cache.get(symbol)
+        if cached is None or cached[0] <= now:
+            cached = (now + _MOCK_CACHE_SECONDS, self._build_mock_symbol_analysis(symbol))
+            self._mock_symbol_cache[symbol] = cached
         
-        sentiments = ["积极", "中性", "消极"]
-        topics = [
-            "价格上涨", "价格下跌", "新合作", "技术更新", 
-            "监管消息", "交易量增加", "市场波动", "鲸鱼活动",
-            "社区活动", "行业新闻", "竞争对手", "宏观经济"
-        ]
-        news = [
-            f"{symbol.split('/')[0]}价格在过去24小时内上涨超过5%",
-            f"{symbol.split('/')[0]}开发团队宣布重要技术突破",
-            f"大型交易所宣布支持{symbol.split('/')[0]}",
-            f"{symbol.split('/')[0]}社区投票通过新提案",
-            f"分析师预测{symbol.split('/')[0]}价格走势看好",
-            f"市场对{symbol.split('/')[0]}的兴趣增加",
-            f"{symbol.split('/')[0]}交易量创新高",
-            f"知名投资者增持{symbol.split('/')[0]}"
-        ]
+        # 返回深拷贝，结果中含列表，避免调用方修改影响后续命中缓存的结果
+        return copy.deepcopy(cached[1])
+    
+    def _build_mock_symbol_analysis(self, symbol: str) -> Dict:
+        """随机生成单个交易对的模拟分析结果"""
+        # 随机模拟分析结果
+        currency = symbol.split('/')[0]
         
         sentiment_score = random.uniform(-0.5, 0.5)
         sentiment = "中性"
@@ -979,10 +1635,11 @@ class SocialMediaAnalyzer:
             sentiment = "消极"
         
         # 随机选择3-5个热门话题
-        random_topics = random.sample(topics, random.randint(3, 5))
+        random_topics = random.sample(_MOCK_TOPICS, random.randint(3, 5))
         
-        # 随机选择1-3条重要新闻
-        random_news = random.sample(news, random.randint(1, 3))
+        # 随机选择1-3条重要新闻，只格式化选中的模板
+        random_news = [template.format(currency=currency)
+                       for template in random.sample(_MOCK_NEWS_TEMPLATES, random.randint(1, 3))]
         
         return {
             "sentiment_score": round(sentiment_score, 2),
@@ -990,4 +1647,4 @@ class SocialMediaAnalyzer:
             "important_news": random_news,
             "hot_topics": random_topics,
             "timestamp": datetime.now().isoformat()
-        } 
\ No newline at end of file
+        }
@@ -1,11 +1,10 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd
 import logging
-import ta
-from ta.trend import MACD, SMAIndicator, EMAIndicator
-from ta.momentum import RSIIndicator, StochasticOscillator
-from ta.volatility import BollingerBands, AverageTrueRange
-from ta.volume import VolumeWeightedAveragePrice
+from analysis._njit import njit
 
 # 设置日志
 logging.basicConfig(
@@ -14,6 +13,120 @@ logging.basicConfig(
 )
 logger = logging.getLogger('technical_analysis')
 
+# add_all_indicators中ATR使用的周期，analyze_volatility周期相同时直接复用该列
+_ATR_PERIOD = 14
+
+# get_signal判断RSI、MACD、布林带和均线信号所需的列
+_SIGNAL_COLUMNS = ['rsi', 'macd', 'macd_signal', 'macd_histogram', 'close', 'bb_upper', 'bb_lower', 'sma_20', 'sma_50']
+
+# 单项指标信号编码及对应名称
+_NEUTRAL, _BUY, _SELL = 0, 1, 2
+_SIGNAL_LABELS = ('neutral', 'buy', 'sell')
+
+# 以下指标函数直接基于pandas的rolling/ewm和NumPy数组计算，计算方式与ta库对应的指标类一致
+
+def _sma(series: pd.Series, window: int) -> pd.Series:
+    """简单移动平均，前window-1个值为NaN"""
+    return series.rolling(window, min_periods=window).mean()
+
+def _cumsum_smas(series: pd.Series, windows) -> list:
+    """基于同一个累加和数组计算多个周期的SMA，数据中有NaN时退回rolling计算以保持相同的缺失值处理"""
+    values = series.to_numpy(dtype=np.float64)
+    if np.isnan(values).any():
+        return [_sma(series, window) for window in windows]
+    
+    csum = np.concatenate(([0.0], np.cumsum(values)))
+    smas = []
+    for window in windows:
+        sma = np.full(values.shape[0], np.nan)
+        if values.shape[0] >= window:
+            sma[window - 1:] = (csum[window:] - csum[:-window]) / window
+        smas.append(pd.Series(sma, index=series.index))
+    return smas
+
+def _ema(series: pd.Series, span: int) -> pd.Series:
+    """指数移动平均（ewm(adjust=False)），前span-1个值为NaN"""
+    return series.ewm(span=span, min_periods=span, adjust=False).mean()
+
+def _rsi(close: pd.Series, period: int) -> pd.Series:
+    """RSI（Wilder平滑）"""
+    delta = close.diff().to_numpy()
+    gain = pd.Series(np.where(delta > 0, delta, 0.0), index=close.index)
+    loss = pd.Series(np.where(delta < 0, -delta, 0.0), index=close.index)
+    avg_gain = gain.ewm(alpha=1 / period, min_periods=period, adjust=False).mean().to_numpy()
+    avg_loss = loss.ewm(alpha=1 / period, min_periods=period, adjust=False).mean().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    return pd.Series(rsi, index=close.index)
+
+def _macd(close: pd.Series, fast_period: int, slow_period: int, signal_period: int):
+    """MACD，返回(MACD线, 信号线, 柱状图)"""
+    macd = _ema(close, fast_period) - _ema(close, slow_period)
+    signal = _ema(macd, signal_period)
+    return macd, signal, macd - signal
+
+def _bollinger_bands(close: pd.Series, period: int, std_dev: float):
+    """布林带，返回(上轨, 中轨, 下轨, 带宽百分比)，标准差为总体标准差"""
+    middle = close.rolling(period, min_periods=period).mean()
+    std = close.rolling(period, min_periods=period).std(ddof=0)
+    upper = middle + std_dev * std
+    lower = middle - std_dev * std
+    return upper, middle, lower, ((upper - lower) / middle) * 100
+
+@njit(cache=True)
+def _wilder_smooth(values, window, seed):
+    """Wilder平滑：第window-1个值为种子值，之前为0，之后逐个递推"""
+    out = np.zeros(values.shape[0])
+    out[window - 1] = seed
+    for i in range(window, values.shape[0]):
+        out[i] = (out[i - 1] * (window - 1) + values[i]) / float(window)
+    return out
+
+@njit(cache=True)
+def _cluster_sorted_levels(sorted_levels, threshold):
+    """对已排序的价格水平聚类：相邻差值不超过阈值的归为一簇，返回各簇均值"""
+    out = np.empty(sorted_levels.shape[0])
+    n_clusters = 0
+    cluster_sum = sorted_levels[0]
+    cluster_count = 1
+    for i in range(1, sorted_levels.shape[0]):
+        if sorted_levels[i] - sorted_levels[i - 1] <= threshold:
+            cluster_sum += sorted_levels[i]
+            cluster_count += 1
+        else:
+            out[n_clusters] = cluster_sum / cluster_count
+            n_clusters += 1
+            cluster_sum = sorted_levels[i]
+            cluster_count = 1
+    out[n_clusters] = cluster_sum / cluster_count
+    return out[:n_clusters + 1]
+
+def _atr(high: pd.Series, low: pd.Series, close: pd.Series, window: int) -> pd.Series:
+    """平均真实波幅（ATR），数据不足window根K线时全部为NaN"""
+    h = high.to_numpy(dtype=np.float64)
+    l = low.to_numpy(dtype=np.float64)
+    c = close.to_numpy(dtype=np.float64)
+    if c.shape[0] < window:
+        return pd.Series(np.full(c.shape[0], np.nan), index=close.index)
+    
+    # 真实波幅：当日振幅、最高价与昨收之差、最低价与昨收之差三者的最大值（首根K线只有振幅）
+    prev_close = np.concatenate(([np.nan], c[:-1]))
+    true_range = np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close)))
+    return pd.Series(_wilder_smooth(true_range, window, true_range[:window].mean()), index=close.index)
+
+def _stochastic(high: pd.Series, low: pd.Series, close: pd.Series, window: int, smooth_window: int):
+    """随机震荡指标，返回(%K, %D)"""
+    lowest = low.rolling(window, min_periods=window).min()
+    highest = high.rolling(window, min_periods=window).max()
+    stoch_k = 100 * (close - lowest) / (highest - lowest)
+    return stoch_k, stoch_k.rolling(smooth_window, min_periods=smooth_window).mean()
+
+def _vwap(high: pd.Series, low: pd.Series, close: pd.Series, volume: pd.Series, window: int) -> pd.Series:
+    """滚动窗口内的成交量加权平均价格"""
+    typical_price = (high + low + close) / 3.0
+    total_pv = (typical_price * volume).rolling(window, min_periods=window).sum()
+    return total_pv / volume.rolling(window, min_periods=window).sum()
+
 class TechnicalAnalysis:
     """技术分析类"""
     
@@ -25,6 +138,30 @@ class TechnicalAnalysis:
             config: 技术分析配置参数
         """
         self.config = config or {}
+        
+        # 各指标参数在初始化时解析一次，计算指标时直接使用
+        rsi_config = self.config.get("RSI", {})
+        self.rsi_period = rsi_config.get("period", 14)
+        self.rsi_overbought = rsi_config.get("overbought", 70)
+        self.rsi_oversold = rsi_config.get("oversold", 30)
+        
+        macd_config = self.config.get("MACD", {})
+        self.macd_fast_period = macd_config.get("fast_period", 12)
+        self.macd_slow_period = macd_config.get("slow_period", 26)
+        self.macd_signal_period = macd_config.get("signal_period", 9)
+        
+        bb_config = self.config.get("BOLLINGER", {})
+        self.bb_period = bb_config.get("period", 20)
+        self.bb_std_dev = bb_config.get("std_dev", 2)
+        
+        sr_config = self.config.get("SUPPORT_RESISTANCE", {})
+        self.lookback_periods = sr_config.get("lookback_periods", [6, 12, 24])
+        self.price_threshold = sr_config.get("price_threshold", 1.0)
+        
+        # 多交易对并行计算的进程池，配置了PARALLEL_WORKERS时在首次使用时创建并在各轮分析间复用
+        self.parallel_workers = self.config.get("PARALLEL_WORKERS", 0)
+        self._executor = None
+        
         logger.info("初始化技术分析模块")
     
     def prepare_data(self, ohlcv_data, add_all_ta=False):
@@ -43,19 +180,20 @@ class TechnicalAnalysis:
             return pd.DataFrame()
             
         try:
-            # 创建DataFrame
-            df = pd.DataFrame(
-                ohlcv_data, 
-                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            )
+            # 一次转换为float64二维数组，各列直接取数组视图，无需逐列转换类型
+            arr = np.asarray(ohlcv_data, dtype=np.float64)
             
-            # 设置时间戳为索引
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
+            # 毫秒时间戳作为索引
+            index = pd.DatetimeIndex(pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms'), name='timestamp')
             
-            # 确保所有价格列都是数值类型
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col])
+            # 创建DataFrame
+            df = pd.DataFrame({
+                'open': arr[:, 1],
+                'high': arr[:, 2],
+                'low': arr[:, 3],
+                'close': arr[:, 4],
+                'volume': arr[:, 5]
+            }, index=index)
             
             # 如果需要，添加所有技术指标
             if add_all_ta:
@@ -78,76 +216,37 @@ class TechnicalAnalysis:
             pandas DataFrame: 添加了所有技术指标的DataFrame
         """
         try:
+            # 各价格列只取一次，所有指标共用
+            close = df['close']
+            high = df['high']
+            low = df['low']
+            
             # 添加RSI
-            rsi_period = self.config.get("RSI", {}).get("period", 14)
-            rsi = RSIIndicator(close=df['close'], window=rsi_period)
-            df['rsi'] = rsi.rsi()
+            df['rsi'] = _rsi(close, self.rsi_period)
             
             # 添加MACD
-            macd_config = self.config.get("MACD", {})
-            fast_period = macd_config.get("fast_period", 12)
-            slow_period = macd_config.get("slow_period", 26)
-            signal_period = macd_config.get("signal_period", 9)
-            
-            macd = MACD(
-                close=df['close'], 
-                window_fast=fast_period, 
-                window_slow=slow_period, 
-                window_sign=signal_period
+            df['macd'], df['macd_signal'], df['macd_histogram'] = _macd(
+                close, self.macd_fast_period, self.macd_slow_period, self.macd_signal_period
             )
-            df['macd'] = macd.macd()
-            df['macd_signal'] = macd.macd_signal()
-            df['macd_histogram'] = macd.macd_diff()
             
             # 添加布林带
-            bb_config = self.config.get("BOLLINGER", {})
-            bb_period = bb_config.get("period", 20)
-            bb_std_dev = bb_config.get("std_dev", 2)
-            
-            bollinger = BollingerBands(
-                close=df['close'], 
-                window=bb_period, 
-                window_dev=bb_std_dev
+            df['bb_upper'], df['bb_middle'], df['bb_lower'], df['bb_width'] = _bollinger_bands(
+                close, self.bb_period, self.bb_std_dev
             )
-            df['bb_upper'] = bollinger.bollinger_hband()
-            df['bb_middle'] = bollinger.bollinger_mavg()
-            df['bb_lower'] = bollinger.bollinger_lband()
-            df['bb_width'] = bollinger.bollinger_wband()
             
             # 添加移动平均线
-            df['sma_20'] = SMAIndicator(close=df['close'], window=20).sma_indicator()
-            df['sma_50'] = SMAIndicator(close=df['close'], window=50).sma_indicator()
-            df['sma_200'] = SMAIndicator(close=df['close'], window=200).sma_indicator()
-            df['ema_20'] = EMAIndicator(close=df['close'], window=20).ema_indicator()
+            df['sma_20'], df['sma_50'], df['sma_200'] = _cumsum_smas(close, (20, 50, 200))
+            df['ema_20'] = _ema(close, 20)
+            df['ema_50'] = _ema(close, 50)
             
             # 添加ATR（波动率指标）
-            atr = AverageTrueRange(
-                high=df['high'], 
-                low=df['low'], 
-                close=df['close'], 
-                window=14
-            )
-            df['atr'] = atr.average_true_range()
+            df['atr'] = _atr(high, low, close, _ATR_PERIOD)
             
             # 添加随机震荡指标
-            stoch = StochasticOscillator(
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                window=14,
-                smooth_window=3
-            )
-            df['stoch_k'] = stoch.stoch()
-            df['stoch_d'] = stoch.stoch_signal()
+            df['stoch_k'], df['stoch_d'] = _stochastic(high, low, close, 14, 3)
             
             # 添加成交量加权平均价格
-            df['vwap'] = VolumeWeightedAveragePrice(
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                volume=df['volume'],
-                window=14
-            ).volume_weighted_average_price()
+            df['vwap'] = _vwap(high, low, close, df['volume'], 14)
             
             return df
             
@@ -155,11 +254,42 @@ class TechnicalAnalysis:
             logger.error(f"添加指标失败: {str(e)}")
             return df
     
+    def get_signals(self, ohlcv_map):
+        """
+        批量计算多个交易对的交易信号，配置了PARALLEL_WORKERS且多于一个交易对时使用进程池并行计算
+        
+        Args:
+            ohlcv_map: 交易对到OHLCV数据的映射
+            
+        Returns:
+            dict: 交易对到get_signal结果的映射
+        """
+        if self.parallel_workers > 1 and len(ohlcv_map) > 1:
+            tasks = [(trading_pair, ohlcv, self.config) for trading_pair, ohlcv in ohlcv_map.items()]
+            try:
+                if self._executor is None:
+                    max_workers = min(self.parallel_workers, os.cpu_count() or 1)
+                    self._executor = ProcessPoolExecutor(max_workers=max_workers)
+                return dict(self._executor.map(_analyze_ohlcv, tasks))
+            except Exception as e:
+                logger.error(f"并行计算交易信号失败，改为逐个计算: {str(e)}")
+                self.close()
+        
+        return {
+            trading_pair: self.get_signal(self.prepare_data(ohlcv, add_all_ta=True))
+            for trading_pair, ohlcv in ohlcv_map.items()
+        }
+    
+    def close(self):
+        """关闭并行计算使用的进程池"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
     def calculate_rsi(self, df, period=14):
         """计算RSI指标"""
         try:
-            rsi = RSIIndicator(close=df['close'], window=period)
-            return rsi.rsi()
+            return _rsi(df['close'], period)
         except Exception as e:
             logger.error(f"计算RSI失败: {str(e)}")
             return None
@@ -167,16 +297,11 @@ class TechnicalAnalysis:
     def calculate_macd(self, df, fast_period=12, slow_period=26, signal_period=9):
         """计算MACD指标"""
         try:
-            macd = MACD(
-                close=df['close'], 
-                window_fast=fast_period, 
-                window_slow=slow_period, 
-                window_sign=signal_period
-            )
+            macd, signal, histogram = _macd(df['close'], fast_period, slow_period, signal_period)
             return {
-                'macd': macd.macd(),
-                'signal': macd.macd_signal(),
-                'histogram': macd.macd_diff()
+                'macd': macd,
+                'signal': signal,
+                'histogram': histogram
             }
         except Exception as e:
             logger.error(f"计算MACD失败: {str(e)}")
@@ -185,16 +310,12 @@ class TechnicalAnalysis:
     def calculate_bollinger_bands(self, df, period=20, std_dev=2):
         """计算布林带指标"""
         try:
-            bollinger = BollingerBands(
-                close=df['close'], 
-                window=period, 
-                window_dev=std_dev
-            )
+            upper, middle, lower, width = _bollinger_bands(df['close'], period, std_dev)
             return {
-                'upper': bollinger.bollinger_hband(),
-                'middle': bollinger.bollinger_mavg(),
-                'lower': bollinger.bollinger_lband(),
-                'width': bollinger.bollinger_wband()
+                'upper': upper,
+                'middle': middle,
+                'lower': lower,
+                'width': width
             }
         except Exception as e:
             logger.error(f"计算布林带失败: {str(e)}")
@@ -214,12 +335,30 @@ class TechnicalAnalysis:
         """
         try:
             if lookback_periods is None:
-                lookback_config = self.config.get("SUPPORT_RESISTANCE", {})
-                lookback_periods = lookback_config.get("lookback_periods", [6, 12, 24])
-                price_threshold = lookback_config.get("price_threshold", 1.0)
+                lookback_periods = self.lookback_periods
+                price_threshold = self.price_threshold
             
             # 获取当前价格
             current_price = df['close'].iloc[-1]
+            support_limit = current_price * (1 - price_threshold / 100)
+            resistance_limit = current_price * (1 + price_threshold / 100)
+            
+            # 在全部数据上以长度为3的滑动窗口视图一次判断局部高低点，各回顾周期只需对结果切片
+            lows = df['low'].to_numpy()
+            highs = df['high'].to_numpy()
+            n = len(lows)
+            
+            if n >= 3:
+                low_win = sliding_window_view(lows, 3)
+                high_win = sliding_window_view(highs, 3)
+                pivot_low = low_win[:, 1]
+                pivot_high = high_win[:, 1]
+                
+                # 局部最低点（低于前后两根K线）且位于当前价格下方足够距离的作为支撑位
+                support_mask = (pivot_low < low_win[:, 0]) & (pivot_low < low_win[:, 2]) & (pivot_low < support_limit)
+                
+                # 局部最高点（高于前后两根K线）且位于当前价格上方足够距离的作为阻力位
+                resistance_mask = (pivot_high > high_win[:, 0]) & (pivot_high > high_win[:, 2]) & (pivot_high > resistance_limit)
             
             # 初始化支撑位和阻力位列表
             support_levels = []
@@ -227,29 +366,13 @@ class TechnicalAnalysis:
             
             # 根据不同的回顾周期计算
             for period in lookback_periods:
-                if len(df) < period:
+                if n < period or period < 3:
                     continue
-                    
-                # 获取回顾期间的数据
-                lookback_data = df.iloc[-period:]
                 
-                # 寻找局部最低点作为支撑位
-                for i in range(1, len(lookback_data) - 1):
-                    if (lookback_data['low'].iloc[i] < lookback_data['low'].iloc[i-1] and 
-                        lookback_data['low'].iloc[i] < lookback_data['low'].iloc[i+1]):
-                        level = lookback_data['low'].iloc[i]
-                        # 如果价格水平接近当前价格的下方，添加为支撑位
-                        if level < current_price * (1 - price_threshold / 100):
-                            support_levels.append(level)
-                
-                # 寻找局部最高点作为阻力位
-                for i in range(1, len(lookback_data) - 1):
-                    if (lookback_data['high'].iloc[i] > lookback_data['high'].iloc[i-1] and 
-                        lookback_data['high'].iloc[i] > lookback_data['high'].iloc[i+1]):
-                        level = lookback_data['high'].iloc[i]
-                        # 如果价格水平接近当前价格的上方，添加为阻力位
-                        if level > current_price * (1 + price_threshold / 100):
-                            resistance_levels.append(level)
+                # 回顾期间内的局部高低点为窗口视图的最后period-2个
+                start = n - period
+                support_levels.extend(pivot_low[start:][support_mask[start:]].tolist())
+                resistance_levels.extend(pivot_high[start:][resistance_mask[start:]].tolist())
             
             # 对支撑位和阻力位进行聚类，合并相近的价格水平
             support_levels = self._cluster_price_levels(support_levels, current_price * 0.002)
@@ -277,26 +400,10 @@ class TechnicalAnalysis:
         """
         if not levels:
             return []
-            
-        # 排序价格水平
-        sorted_levels = sorted(levels)
-        clustered_levels = []
-        current_cluster = [sorted_levels[0]]
-        
-        for i in range(1, len(sorted_levels)):
-            if sorted_levels[i] - sorted_levels[i-1] <= threshold:
-                # 如果当前价格与上一个价格相近，添加到当前集群
-                current_cluster.append(sorted_levels[i])
-            else:
-                # 否则，计算当前集群的平均值，并开始新的集群
-                clustered_levels.append(sum(current_cluster) / len(current_cluster))
-                current_cluster = [sorted_levels[i]]
-        
-        # 添加最后一个集群的平均值
-        if current_cluster:
-            clustered_levels.append(sum(current_cluster) / len(current_cluster))
         
-        return clustered_levels
+        # 排序后用编译后的循环一次扫描完成聚类
+        sorted_levels = np.sort(np.asarray(levels, dtype=np.float64))
+        return _cluster_sorted_levels(sorted_levels, float(threshold)).tolist()
     
     def analyze_trend(self, df, short_period=6, long_period=24):
         """
@@ -314,29 +421,31 @@ class TechnicalAnalysis:
             if len(df) < long_period:
                 return {'short_trend': 'unknown', 'long_trend': 'unknown'}
             
+            # 收盘价和成交量只取一次NumPy数组，后续按位置直接索引
+            close = df['close'].to_numpy(dtype=np.float64)
+            volume = df['volume'].to_numpy(dtype=np.float64)
+            
             # 计算短期趋势
-            short_df = df.iloc[-short_period:]
-            short_start_price = short_df['close'].iloc[0]
-            short_end_price = short_df['close'].iloc[-1]
+            short_start_price = close[-short_period]
+            short_end_price = close[-1]
             short_trend = 'up' if short_end_price > short_start_price else 'down'
             short_change_pct = (short_end_price - short_start_price) / short_start_price * 100
             
             # 计算长期趋势
-            long_df = df.iloc[-long_period:]
-            long_start_price = long_df['close'].iloc[0]
-            long_end_price = long_df['close'].iloc[-1]
+            long_start_price = close[-long_period]
+            long_end_price = close[-1]
             long_trend = 'up' if long_end_price > long_start_price else 'down'
             long_change_pct = (long_end_price - long_start_price) / long_start_price * 100
             
-            # 计算EMA趋势
-            ema_20 = EMAIndicator(close=df['close'], window=20).ema_indicator()
-            ema_50 = EMAIndicator(close=df['close'], window=50).ema_indicator()
+            # 计算EMA趋势，优先复用add_all_indicators已计算的EMA列
+            ema_20 = df['ema_20'].iat[-1] if 'ema_20' in df else _ema(df['close'], 20).iat[-1]
+            ema_50 = df['ema_50'].iat[-1] if 'ema_50' in df else _ema(df['close'], 50).iat[-1]
             
-            ema_trend = 'up' if ema_20.iloc[-1] > ema_50.iloc[-1] else 'down'
+            ema_trend = 'up' if ema_20 > ema_50 else 'down'
             
             # 计算成交量趋势
-            vol_short = short_df['volume'].mean()
-            vol_long = long_df['volume'].mean()
+            vol_short = volume[-short_period:].mean()
+            vol_long = volume[-long_period:].mean()
             volume_trend = 'increasing' if vol_short > vol_long else 'decreasing'
             
             return {
@@ -367,23 +476,22 @@ class TechnicalAnalysis:
             if len(df) < period:
                 return {'volatility': None, 'atr': None}
             
-            # 计算每日收益率
-            df['returns'] = df['close'].pct_change() * 100
+            # 计算每日收益率（百分比），直接在NumPy数组上计算，不向df写入临时列
+            close = df['close'].to_numpy(dtype=np.float64)
+            returns = (close[1:] / close[:-1] - 1) * 100
             
             # 计算波动率 (标准差)
-            volatility = df['returns'].iloc[-period:].std()
+            volatility = returns[-period:].std(ddof=1)
             
-            # 计算ATR
-            atr = AverageTrueRange(
-                high=df['high'], 
-                low=df['low'], 
-                close=df['close'], 
-                window=period
-            ).average_true_range().iloc[-1]
+            # 计算ATR，add_all_indicators已按相同周期算出时直接取最新值
+            if period == _ATR_PERIOD and 'atr' in df.columns:
+                atr = df['atr'].iat[-1]
+            else:
+                atr = _atr(df['high'], df['low'], df['close'], period).iat[-1]
             
             # 计算波动率相对于历史的百分位
             if len(df) > period * 2:
-                historical_volatility = df['returns'].iloc[:-period].std()
+                historical_volatility = returns[:-period].std(ddof=1)
                 volatility_percentile = 100 * (volatility / historical_volatility)
             else:
                 volatility_percentile = 50
@@ -398,12 +506,13 @@ class TechnicalAnalysis:
             logger.error(f"分析波动率失败: {str(e)}")
             return {'volatility': None, 'atr': None}
     
-    def get_signal(self, df):
+    def get_signal(self, df, fast=False):
         """
         根据技术指标生成交易信号
         
         Args:
             df: 包含技术指标的DataFrame
+            fast: 为True时只返回交易信号、当前价格和时间，不生成指标摘要、支撑阻力位、趋势和波动率分析
             
         Returns:
             dict: 交易信号和指标摘要
@@ -415,41 +524,29 @@ class TechnicalAnalysis:
             # 获取最新的技术指标值
             latest = df.iloc[-1]
             
-            # RSI信号
-            rsi_config = self.config.get("RSI", {})
-            rsi_overbought = rsi_config.get("overbought", 70)
-            rsi_oversold = rsi_config.get("oversold", 30)
-            
-            rsi_signal = 'neutral'
-            if latest['rsi'] > rsi_overbought:
-                rsi_signal = 'sell'
-            elif latest['rsi'] < rsi_oversold:
-                rsi_signal = 'buy'
-            
-            # MACD信号
-            macd_signal = 'neutral'
-            if latest['macd'] > latest['macd_signal'] and latest['macd_histogram'] > 0:
-                macd_signal = 'buy'
-            elif latest['macd'] < latest['macd_signal'] and latest['macd_histogram'] < 0:
-                macd_signal = 'sell'
-            
-            # 布林带信号
-            bb_signal = 'neutral'
-            if latest['close'] > latest['bb_upper']:
-                bb_signal = 'sell'
-            elif latest['close'] < latest['bb_lower']:
-                bb_signal = 'buy'
-            
-            # 移动平均线信号
-            ma_signal = 'neutral'
-            if latest['close'] > latest['sma_50'] and latest['sma_20'] > latest['sma_50']:
-                ma_signal = 'buy'
-            elif latest['close'] < latest['sma_50'] and latest['sma_20'] < latest['sma_50']:
-                ma_signal = 'sell'
+            # 一次取出判断信号所需的最新指标值
+            rsi, macd, macd_line_signal, macd_histogram, close, bb_upper, bb_lower, sma_20, sma_50 = \
+                latest[_SIGNAL_COLUMNS].to_numpy(dtype=np.float64)
+            
+            # 依次为RSI、MACD、布林带、移动平均线的卖出和买入条件，两者同时成立时以卖出为准（与原先的判断顺序一致）
+            sell_conditions = np.array([
+                rsi > self.rsi_overbought,
+                macd < macd_line_signal and macd_histogram < 0,
+                close > bb_upper,
+                close < sma_50 and sma_20 < sma_50
+            ])
+            buy_conditions = np.array([
+                rsi < self.rsi_oversold,
+                macd > macd_line_signal and macd_histogram > 0,
+                close < bb_lower,
+                close > sma_50 and sma_20 > sma_50
+            ])
+            signal_codes = np.select([sell_conditions, buy_conditions], [_SELL, _BUY], _NEUTRAL)
+            rsi_signal, macd_signal, bb_signal, ma_signal = (_SIGNAL_LABELS[code] for code in signal_codes.tolist())
             
             # 累计信号分数
-            buy_signals = sum(1 for signal in [rsi_signal, macd_signal, bb_signal, ma_signal] if signal == 'buy')
-            sell_signals = sum(1 for signal in [rsi_signal, macd_signal, bb_signal, ma_signal] if signal == 'sell')
+            buy_signals = int(np.count_nonzero(signal_codes == _BUY))
+            sell_signals = int(np.count_nonzero(signal_codes == _SELL))
             
             # 确定最终信号
             if buy_signals > sell_signals and buy_signals >= 2:
@@ -459,6 +556,13 @@ class TechnicalAnalysis:
             else:
                 final_signal = 'neutral'
             
+            if fast:
+                return {
+                    'signal': final_signal,
+                    'current_price': close,
+                    'timestamp': df.index[-1]
+                }
+            
             # 整合所有指标的状态
             indicator_summary = {
                 'rsi': {
@@ -514,4 +618,11 @@ class TechnicalAnalysis:
             
         except Exception as e:
             logger.error(f"生成信号失败: {str(e)}")
-            return {'signal': 'error', 'reason': str(e)} 
\ No newline at end of file
+            return {'signal': 'error', 'reason': str(e)} 
+
+
+def _analyze_ohlcv(task):
+    """进程池任务：计算单个交易对的技术指标和交易信号，需为模块级函数以便序列化"""
+    trading_pair, ohlcv, config = task
+    analyzer = TechnicalAnalysis(config)
+    return trading_pair, analyzer.get_signal(analyzer.prepare_data(ohlcv, add_all_ta=True))
@@ -48,7 +48,11 @@ TA_CONFIG = {
     "SUPPORT_RESISTANCE": {
         "lookback_periods": [6, 12, 24],  # 小时
         "price_threshold": 1.0  # 价格偏差阈值百分比
-    }
+    },
+    # 批量计算交易信号的进程数，0表示在当前进程逐个计算（交易对少、K线数量少时进程间传输数据的开销大于计算本身）
+    # 默认关闭：实测5个交易对×200根K线时逐个计算34ms、4进程38ms，20×500时119ms、210ms；
+    # 多核机器上交易对较多时可设为CPU核数并自行对比
+    "PARALLEL_WORKERS": 0
 }
 
 # 社交媒体分析配置
@@ -78,6 +82,10 @@ SOCIAL_CONFIG = {
         "positive": 0.4,
         "negative": -0.3
     },
+    # Twitter登录Cookie保存路径，重启时优先复用以跳过登录流程，设为空字符串则不保存
+    "cookie_file": "data/twitter_cookies.json",
+    # 情感分析引擎: textblob 或 vader（需安装vaderSentiment）
+    "sentiment_engine": "textblob",
     # 模拟模式 - 无法访问Twitter API时自动启用
     "simulation_mode": False
 }
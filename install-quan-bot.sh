@@ -129,7 +129,7 @@ if [ $? -ne 0 ]; then
     pip install wheel
     pip install numpy pandas>=2.1.1 matplotlib scipy>=1.11.0
     pip install ccxt python-binance okx
-    pip install selenium webdriver-manager textblob nltk
+    pip install selenium webdriver-manager textblob
     pip install requests json5 python-dotenv
     pip install pandas-ta scikit-learn
     pip install tqdm colorama
@@ -123,6 +123,7 @@ class CryptoQuantTrader:
         except Exception as e:
             logger.error(f"系统运行出错: {str(e)}", exc_info=True)
         finally:
+            self.technical_analyzer.close()
             logger.info("关闭加密货币量化交易系统")
     
     def run_analysis(self):
@@ -140,25 +141,35 @@ class CryptoQuantTrader:
                 self.social_data_cache = self.social_analyzer.analyze_binance_tweets()
                 self.last_social_update = current_time
             
-            # 分析每个交易对
+            # 先获取所有交易对的K线数据，再并行计算技术分析信号
+            ohlcv_map = {}
             for trading_pair in config.TRADING_PAIRS:
-                self.analyze_trading_pair(trading_pair)
+                ohlcv = self._fetch_ohlcv(trading_pair)
+                if ohlcv is not None:
+                    ohlcv_map[trading_pair] = ohlcv
+            
+            technical_signals = self.technical_analyzer.get_signals(ohlcv_map)
+            
+            # 分析每个交易对
+            for trading_pair, technical_analysis in technical_signals.items():
+                self.analyze_trading_pair(trading_pair, technical_analysis)
             
             logger.info("市场分析完成")
             
         except Exception as e:
             logger.error(f"分析过程出错: {str(e)}", exc_info=True)
     
-    def analyze_trading_pair(self, trading_pair):
+    def _fetch_ohlcv(self, trading_pair):
         """
-        分析单个交易对
+        获取交易对的历史K线数据
         
         Args:
             trading_pair: 交易对
+            
+        Returns:
+            list: OHLCV数据，数据不足或获取失败时返回None
         """
         try:
-            logger.info(f"分析交易对: {trading_pair}")
-            
             # 获取历史K线数据，使用配置的时间周期
             ohlcv = self.exchange_client.get_historical_data(
                 symbol=trading_pair,
@@ -168,13 +179,35 @@ class CryptoQuantTrader:
             
             if not ohlcv or len(ohlcv) < 50:
                 logger.warning(f"获取 {trading_pair} 的历史数据不足，跳过分析")
-                return
+                return None
             
-            # 准备数据并添加技术指标
-            df = self.technical_analyzer.prepare_data(ohlcv, add_all_ta=True)
+            return ohlcv
+            
+        except Exception as e:
+            logger.error(f"获取 {trading_pair} 的历史数据出错: {str(e)}", exc_info=True)
+            return None
+    
+    def analyze_trading_pair(self, trading_pair, technical_analysis=None):
+        """
+        分析单个交易对
+        
+        Args:
+            trading_pair: 交易对
+            technical_analysis: 已计算好的技术分析结果，为None时获取K线数据并计算
+        """
+        try:
+            logger.info(f"分析交易对: {trading_pair}")
             
-            # 获取技术分析信号
-            technical_analysis = self.technical_analyzer.get_signal(df)
+            if technical_analysis is None:
+                ohlcv = self._fetch_ohlcv(trading_pair)
+                if ohlcv is None:
+                    return
+                
+                # 准备数据并添加技术指标
+                df = self.technical_analyzer.prepare_data(ohlcv, add_all_ta=True)
+                
+                # 获取技术分析信号
+                technical_analysis = self.technical_analyzer.get_signal(df)
             
             # 获取当前价格
             ticker = self.exchange_client.get_ticker(trading_pair)
@@ -963,7 +963,9 @@ class Menu:
                     # AI分析
                     print("\n🤖 正在运行AI分析...")
                     ai_analyzer = AIAnalyzer()
-                    ai_summary = ai_analyzer.get_ai_summary()
+                    # 每个交易对使用第一个周期的分析结果作为AI分析的市场数据
+                    market_data = {symbol: next(iter(timeframes.values())) for symbol, timeframes in market_summary["symbols"].items()}
+                    ai_summary = ai_analyzer.get_ai_summary(market_data)
                     
                     # 显示AI分析结果
                     print("\n📈 AI分析结果:")
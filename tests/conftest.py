@@ -0,0 +1,69 @@
+import os
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# 项目没有打包安装，测试直接从仓库根目录导入
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# 指标测试不访问交易所；未安装ccxt/python-binance时用空的ExchangeClient代替，使market_analysis可以导入
+try:
+    import exchanges.exchange_client  # noqa: F401
+except ImportError:
+    stub = types.ModuleType("exchanges.exchange_client")
+
+    class ExchangeClient:
+        """测试用的空交易所客户端"""
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+    stub.ExchangeClient = ExchangeClient
+    sys.modules["exchanges.exchange_client"] = stub
+
+
+def make_ohlcv(n: int, seed: int = 0, flat: bool = True) -> list:
+    """
+    生成随机K线，结构为[[timestamp, open, high, low, close, volume], ...]
+
+    Args:
+        n: K线数量
+        seed: 随机种子
+        flat: 是否加入一段价格不变的K线，覆盖跌幅为0、振幅为0的情况
+
+    Returns:
+        list: OHLCV数据
+    """
+    rng = np.random.default_rng(seed)
+    close = 30000 + np.cumsum(rng.normal(0, 50, n))
+    open_ = close + rng.normal(0, 10, n)
+    high = np.maximum(open_, close) + rng.random(n) * 30
+    low = np.minimum(open_, close) - rng.random(n) * 30
+    volume = rng.random(n) * 100
+    if flat and n > 30:
+        close[5:25] = open_[5:25] = high[5:25] = low[5:25] = close[5]
+    timestamps = 1700000000000 + np.arange(n) * 3600000
+    return [[int(t), o, h, l, c, v] for t, o, h, l, c, v in zip(timestamps, open_, high, low, close, volume)]
+
+
+@pytest.fixture
+def ohlcv():
+    """500根随机K线"""
+    return make_ohlcv(500)
+
+
+@pytest.fixture
+def close_frame():
+    """生成只含timestamp和close列的K线，与交易所客户端返回的格式一致"""
+    def build(n: int, seed: int = 0) -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        return pd.DataFrame({
+            'timestamp': np.arange(n) * 3600000,
+            'close': 100 + np.cumsum(rng.normal(size=n))
+        })
+    return build
@@ -0,0 +1,108 @@
+import json
+import math
+
+import httpx
+import numpy as np
+import pytest
+
+from analysis import ai_analysis
+from analysis.ai_analysis import AIAnalyzer, _JsonObjectScanner, _first_json_object, _json_dumps
+from analysis.market_analysis import BBResult, MACDResult, RSIResult
+
+
+@pytest.mark.parametrize("text, opener, expected", [
+    ('{"a": 1}', "{", '{"a": 1}'),
+    ('说明文字 {"a": {"b": [1, 2]}} 之后的文字 {"c": 3}', "{", '{"a": {"b": [1, 2]}}'),
+    ('{"reason": "含有}括号{的字符串", "x": 1}', "{", '{"reason": "含有}括号{的字符串", "x": 1}'),
+    ('{"reason": "转义的\\"引号}", "x": 1} tail', "{", '{"reason": "转义的\\"引号}", "x": 1}'),
+    ('```json\n[{"symbol": "BTC/USDT"}, {"symbol": "ETH/USDT"}]\n```', "[",
+     '[{"symbol": "BTC/USDT"}, {"symbol": "ETH/USDT"}]'),
+    ('没有JSON', "{", None),
+    ('{"unterminated": 1', "{", None),
+])
+def test_first_json_object(text, opener, expected):
+    assert _first_json_object(text, opener) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_scanner_finds_object_across_chunks(chunk_size):
+    """流式输出时JSON对象被任意切分，结果与一次扫描相同"""
+    text = '好的，分析如下：{"trend": "看涨", "reason": "突破}阻力位\\"", "confidence": 80} 以上仅供参考 {"x": 1}'
+    scanner = _JsonObjectScanner()
+    received = ""
+    for i in range(0, len(text), chunk_size):
+        received += text[i:i + chunk_size]
+        if scanner.feed(text[i:i + chunk_size]):
+            break
+
+    assert received[scanner.start:scanner.end] == _first_json_object(text)
+    # 找到完整对象后不再需要读取剩余内容
+    assert len(received) < len(text)
+
+
+def sse_response(content: str, chunk_size: int = 5) -> httpx.Response:
+    """按chunk_size切分content，构造流式(SSE)响应"""
+    events = [
+        f"data: {json.dumps({'choices': [{'delta': {'content': content[i:i + chunk_size]}}]})}\n\n"
+        for i in range(0, len(content), chunk_size)
+    ]
+    events.append("data: [DONE]\n\n")
+    return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content="".join(events).encode())
+
+
+@pytest.fixture
+def analyzer():
+    """使用模拟传输层的AI分析器"""
+    analyzer = AIAnalyzer()
+    analyzer.api_key = "test"
+    return analyzer
+
+
+def test_call_api_stream_returns_first_json_object(analyzer):
+    content = '{"trend": "看跌", "confidence": 60, "action": "卖出", "reason": "跌破}支撑"} 多余的解释'
+    analyzer._client = httpx.Client(transport=httpx.MockTransport(lambda request: sse_response(content)))
+
+    result = analyzer._call_api("prompt", stream=True)
+    assert json.loads(_first_json_object(result)) == json.loads(_first_json_object(content))
+
+
+def test_call_api_stream_array(analyzer):
+    content = '[{"symbol": "BTC/USDT", "trend": "看涨"}, {"symbol": "ETH/USDT", "trend": "震荡"}]'
+    analyzer._client = httpx.Client(transport=httpx.MockTransport(lambda request: sse_response(content, 3)))
+
+    result = analyzer._call_api("prompt", stream=True, opener="[")
+    assert json.loads(_first_json_object(result, "[")) == json.loads(content)
+
+
+def test_call_api_single_retry_loop(analyzer, monkeypatch):
+    """连接失败和可重试状态码共用一个重试循环"""
+    monkeypatch.setattr(ai_analysis, "_RETRY_BACKOFF", 0)
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("refused")
+        if len(attempts) == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"choices": [{"message": {"content": '{"a": 1}'}}]})
+
+    analyzer._client = httpx.Client(transport=httpx.MockTransport(handler))
+    assert analyzer._call_api("prompt") == '{"a": 1}'
+    assert len(attempts) == 3
+
+
+@pytest.mark.parametrize("obj", [
+    RSIResult(rsi=float("nan"), is_overbought=False, is_oversold=False),
+    RSIResult(rsi=np.float64(55.5), is_overbought=np.bool_(True), is_oversold=False),
+    MACDResult(macd=1.0, signal=np.nan, hist=-math.inf, is_bullish=True, is_bearish=False),
+    BBResult(upper=1.5, middle=2, lower=3, is_overbought=True, is_oversold=False),
+    {"a": [1, 2.5, float("nan"), np.float64("inf"), np.int64(3), np.float32(0.5)], "中文": "值", "b": None},
+    {"arr": np.array([1.0, np.nan])},
+])
+def test_json_dumps_fallback_matches_orjson(obj, monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    expected = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    monkeypatch.setattr(ai_analysis, "orjson", None)
+    assert _json_dumps(obj) == expected
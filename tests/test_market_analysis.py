@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.market_analysis import MarketAnalyzer
+
+
+def baseline_rsi(close: pd.Series, period: int = 14) -> float:
+    """原pandas实现：涨跌幅的简单移动平均"""
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    return (100 - (100 / (1 + gain / loss))).iloc[-1]
+
+
+def wilder_rsi(close: pd.Series, period: int = 14) -> float:
+    """Wilder平滑的RSI：前period个差值的均值作为种子，之后逐个递推"""
+    delta = close.diff().to_numpy()[1:]
+    if delta.shape[0] < period:
+        return np.nan
+    gain, loss = np.clip(delta, 0, None), np.clip(-delta, 0, None)
+    avg_gain, avg_loss = gain[:period].mean(), loss[:period].mean()
+    for g, l in zip(gain[period:], loss[period:]):
+        avg_gain = (avg_gain * (period - 1) + g) / period
+        avg_loss = (avg_loss * (period - 1) + l) / period
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else np.nan
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def baseline_macd(close: pd.Series):
+    """原pandas实现"""
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    signal = macd.ewm(span=9, adjust=False).mean()
+    return macd.iloc[-1], signal.iloc[-1], (macd - signal).iloc[-1]
+
+
+def baseline_bollinger_bands(close: pd.Series, period: int = 20):
+    """原pandas实现（样本标准差）"""
+    sma = close.rolling(window=period).mean()
+    std = close.rolling(window=period).std()
+    return (sma + std * 2).iloc[-1], sma.iloc[-1], (sma - std * 2).iloc[-1]
+
+
+def indicator_values(indicators):
+    """指标结果中的数值"""
+    return [
+        indicators['RSI'].rsi,
+        indicators['MACD'].macd, indicators['MACD'].signal, indicators['MACD'].hist,
+        indicators['BB'].upper, indicators['BB'].middle, indicators['BB'].lower
+    ]
+
+
+@pytest.mark.parametrize("n", [5, 14, 15, 30, 300, 1000])
+@pytest.mark.parametrize("rsi_smoothing", ["sma", "wilder"])
+def test_stateless_indicators_match_pandas(close_frame, n, rsi_smoothing):
+    df = close_frame(n)
+    analyzer = MarketAnalyzer({"rsi_smoothing": rsi_smoothing, "incremental_indicators": False})
+    indicators = analyzer._calculate_indicators(df)
+
+    close = df['close']
+    rsi = baseline_rsi(close) if rsi_smoothing == "sma" else wilder_rsi(close)
+    expected = [rsi, *baseline_macd(close), *baseline_bollinger_bands(close)]
+    np.testing.assert_allclose(indicator_values(indicators), expected, rtol=1e-10, equal_nan=True)
+
+
+@pytest.mark.parametrize("rsi_smoothing", ["sma", "wilder"])
+def test_incremental_state_matches_full_history(close_frame, rsi_smoothing):
+    """每次只获取最近100根K线，增量状态的结果与在完整历史上计算相同"""
+    df = close_frame(400, seed=1)
+    analyzer = MarketAnalyzer({"rsi_smoothing": rsi_smoothing})
+
+    for end in list(range(2, 60)) + list(range(100, 400, 7)):
+        window = df.iloc[max(0, end - 100):end].reset_index(drop=True)
+        incremental = analyzer._calculate_indicators(window, ("BTC/USDT", "1h"))
+        full = analyzer._calculate_indicators(df.iloc[:end])
+        np.testing.assert_allclose(indicator_values(incremental), indicator_values(full),
+                                   rtol=1e-9, equal_nan=True)
+
+
+def test_revised_bar_rebuilds_state(close_frame):
+    """已写入状态的K线收盘价被修正时重建状态"""
+    df = close_frame(300, seed=2)
+    analyzer = MarketAnalyzer()
+    analyzer._calculate_indicators(df, ("BTC/USDT", "1h"))
+
+    revised = df.copy()
+    revised.loc[len(df) - 2, 'close'] += 5
+    window = revised.iloc[-100:].reset_index(drop=True)
+    incremental = analyzer._calculate_indicators(window, ("BTC/USDT", "1h"))
+    stateless = analyzer._calculate_indicators(window)
+    np.testing.assert_allclose(indicator_values(incremental), indicator_values(stateless), rtol=1e-9)
+
+
+def test_gap_rebuilds_state(close_frame):
+    """K线不连续时重建状态"""
+    df = close_frame(300, seed=3)
+    analyzer = MarketAnalyzer()
+    analyzer._calculate_indicators(df.iloc[:200], ("BTC/USDT", "1h"))
+
+    window = df.iloc[250:].reset_index(drop=True)
+    incremental = analyzer._calculate_indicators(window, ("BTC/USDT", "1h"))
+    stateless = analyzer._calculate_indicators(window)
+    np.testing.assert_allclose(indicator_values(incremental), indicator_values(stateless), rtol=1e-9)
@@ -0,0 +1,60 @@
+import re
+
+import pytest
+
+from analysis.social_analysis import SocialMediaAnalyzer
+
+
+def baseline_clean_text(text: str) -> str:
+    """原实现：依次执行四次替换后转为小写"""
+    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'@\w+', '', text)
+    text = re.sub(r'[^\w\s]', '', text)
+    text = re.sub(r'\d+', '', text)
+    return text.lower()
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    """模拟模式的分析器，不连接Twitter"""
+    return SocialMediaAnalyzer({"simulation_mode": True})
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "Hello World",
+    "BTC to the moon!!! 🚀🚀 https://t.co/abc123 #Bitcoin",
+    "@binance listed $XYZ at 10:00 UTC, see www.binance.com/en/support",
+    "@user@other mention chain",
+    "@userhttps://t.co/x attached url",
+    "@user_www.example.com",
+    "price 1,234.56 USDT (up 12%)",
+    "Multi\nline\ttext with  spaces",
+    "中文推文：币安上线新币 100%",
+    "mixed @张三 提及 http://例子.com",
+    "HTTPS://UPPER.CASE url and Www.Mixed.Case",
+])
+def test_clean_text_matches_baseline(analyzer, text):
+    assert analyzer._clean_text(text) == baseline_clean_text(text)
+
+
+@pytest.mark.parametrize("count_str, expected", [
+    # 与原实现结果相同
+    (None, 0),
+    ("", 0),
+    ("0", 0),
+    ("42", 42),
+    ("1,234", 1234),
+    ("1.2K", 1200),
+    ("3k", 3000),
+    ("15K", 15000),
+    ("2.5M", 2500000),
+    ("7m", 7000000),
+    ("abc", 0),
+    (" 12 ", 12),
+    # 原实现解析失败返回0，现在可以识别
+    ("1.2B", 1200000000),
+    ("1,234K", 1234000),
+])
+def test_parse_count(analyzer, count_str, expected):
+    assert analyzer._parse_count(count_str) == expected
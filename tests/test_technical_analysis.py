@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.technical_analysis import TechnicalAnalysis
+from conftest import make_ohlcv
+
+ta = pytest.importorskip("ta")
+from ta.momentum import RSIIndicator, StochasticOscillator  # noqa: E402
+from ta.trend import MACD, EMAIndicator, SMAIndicator  # noqa: E402
+from ta.volatility import AverageTrueRange, BollingerBands  # noqa: E402
+from ta.volume import VolumeWeightedAveragePrice  # noqa: E402
+
+
+def assert_series_equal(actual: pd.Series, expected: pd.Series):
+    """数值在浮点误差内相同，NaN位置一致"""
+    np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(), rtol=1e-10, atol=1e-9, equal_nan=True)
+
+
+@pytest.fixture(params=[500, 260, 60, 10])
+def indicators(request):
+    """添加了所有指标的DataFrame，覆盖数据量不足各指标周期的情况"""
+    return TechnicalAnalysis().prepare_data(make_ohlcv(request.param), add_all_ta=True)
+
+
+def test_rsi_matches_ta(indicators):
+    expected = RSIIndicator(close=indicators['close'], window=14).rsi()
+    assert_series_equal(indicators['rsi'], expected)
+
+
+def test_macd_matches_ta(indicators):
+    macd = MACD(close=indicators['close'], window_fast=12, window_slow=26, window_sign=9)
+    assert_series_equal(indicators['macd'], macd.macd())
+    assert_series_equal(indicators['macd_signal'], macd.macd_signal())
+    assert_series_equal(indicators['macd_histogram'], macd.macd_diff())
+
+
+def test_bollinger_bands_match_ta(indicators):
+    bollinger = BollingerBands(close=indicators['close'], window=20, window_dev=2)
+    assert_series_equal(indicators['bb_upper'], bollinger.bollinger_hband())
+    assert_series_equal(indicators['bb_middle'], bollinger.bollinger_mavg())
+    assert_series_equal(indicators['bb_lower'], bollinger.bollinger_lband())
+    assert_series_equal(indicators['bb_width'], bollinger.bollinger_wband())
+
+
+def test_moving_averages_match_ta(indicators):
+    for window in (20, 50, 200):
+        expected = SMAIndicator(close=indicators['close'], window=window).sma_indicator()
+        assert_series_equal(indicators[f'sma_{window}'], expected)
+    for window in (20, 50):
+        expected = EMAIndicator(close=indicators['close'], window=window).ema_indicator()
+        assert_series_equal(indicators[f'ema_{window}'], expected)
+
+
+def test_atr_matches_ta(indicators):
+    if len(indicators) < 14:
+        # ta在数据不足窗口时抛出异常，这里约定全部为NaN
+        assert indicators['atr'].isna().all()
+        return
+    expected = AverageTrueRange(high=indicators['high'], low=indicators['low'], close=indicators['close'],
+                                window=14).average_true_range()
+    # ta把预热期填为0
+    expected = expected.where(np.arange(len(expected)) >= 13, 0.0)
+    assert_series_equal(indicators['atr'].fillna(0.0), expected)
+
+
+def test_stochastic_matches_ta(indicators):
+    stoch = StochasticOscillator(high=indicators['high'], low=indicators['low'], close=indicators['close'],
+                                 window=14, smooth_window=3)
+    assert_series_equal(indicators['stoch_k'], stoch.stoch())
+    assert_series_equal(indicators['stoch_d'], stoch.stoch_signal())
+
+
+def test_vwap_matches_ta(indicators):
+    expected = VolumeWeightedAveragePrice(high=indicators['high'], low=indicators['low'], close=indicators['close'],
+                                          volume=indicators['volume'], window=14).volume_weighted_average_price()
+    assert_series_equal(indicators['vwap'], expected)
+
+
+def test_get_signals_matches_get_signal():
+    analyzer = TechnicalAnalysis()
+    ohlcv_map = {f"S{i}/USDT": make_ohlcv(300, seed=i) for i in range(3)}
+    signals = analyzer.get_signals(ohlcv_map)
+
+    assert list(signals) == list(ohlcv_map)
+    for trading_pair, ohlcv in ohlcv_map.items():
+        expected = analyzer.get_signal(analyzer.prepare_data(ohlcv, add_all_ta=True))
+        assert signals[trading_pair] == expected